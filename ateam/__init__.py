@@ -8,24 +8,35 @@ in persistent conversation rooms with shared context and memory.
 __version__ = "0.1.0"
 __author__ = "A-Team Contributors"
 
-from ateam.core.room import RoomManager, RoomMetadata
-from ateam.core.history import HistoryManager, Message
-from ateam.core.context import ContextManager
-from ateam.core.config import ConfigManager
-from ateam.core.router import AgentRouter
-from ateam.tools.manager import ToolManager
-from ateam.providers import BaseProvider, ProviderConfig, ProviderFactory
-
-__all__ = [
-    "RoomManager",
-    "RoomMetadata",
-    "HistoryManager",
-    "Message",
-    "ContextManager",
-    "ConfigManager",
-    "AgentRouter",
-    "ToolManager",
-    "BaseProvider",
-    "ProviderConfig",
-    "ProviderFactory",
-]
+import importlib
+
+# Public names -> defining module, imported on first access (PEP 562) so that
+# `from ateam import __version__` doesn't load the providers and their SDKs
+_LAZY = {
+    "RoomManager": "ateam.core.room",
+    "RoomMetadata": "ateam.core.room",
+    "HistoryManager": "ateam.core.history",
+    "Message": "ateam.core.history",
+    "ContextManager": "ateam.core.context",
+    "ConfigManager": "ateam.core.config",
+    "AgentRouter": "ateam.core.router",
+    "ToolManager": "ateam.tools.manager",
+    "BaseProvider": "ateam.providers",
+    "ProviderConfig": "ateam.providers",
+    "ProviderFactory": "ateam.providers",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
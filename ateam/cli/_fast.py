@@ -0,0 +1,109 @@
+"""
+Opt-in cyclopts front end for A-Team CLI (ATEAM_FAST_CLI=1).
+
+Exposes the same commands as the Typer app in ateam.cli.main without
+building its Click command group. Each command imports ateam.cli.main only
+when invoked and runs the existing command body, so both front ends share
+one implementation.
+
+Requires the `fast-cli` extra (cyclopts).
+"""
+
+import sys
+from typing import Annotated, Optional
+
+from cyclopts import App, Parameter
+
+from ateam import __version__
+
+app = App(
+    name="ateam",
+    help="Production-grade, security-hardened multi-agent AI orchestration tool",
+    version=__version__,
+)
+
+
+def _call(command: str, *args) -> None:
+    """Run a Typer command body, turning its typer.Exit into the process exit code."""
+    import typer
+    from ateam.cli import main
+
+    try:
+        getattr(main, command)(*args)
+    except typer.Exit as e:
+        sys.exit(e.exit_code)
+
+
+@app.command
+def version() -> None:
+    """Show A-Team version information."""
+    _call("version")
+
+
+@app.command
+def init() -> None:
+    """Initialize A-Team configuration (interactive setup)."""
+    _call("init")
+
+
+@app.command
+def join(
+    room_name: str,
+    *,
+    description: Annotated[Optional[str], Parameter(name=["--description", "-d"])] = None,
+) -> None:
+    """
+    Create or join a conversation room.
+
+    Parameters
+    ----------
+    room_name
+        Name of the room to join
+    description
+        Room description (for new rooms)
+    """
+    _call("join", room_name, description)
+
+
+@app.command
+def rooms() -> None:
+    """List all available rooms."""
+    _call("rooms")
+
+
+@app.command
+def status() -> None:
+    """Show current session status and last active room."""
+    _call("status")
+
+
+@app.command
+def web(*, port: Annotated[int, Parameter(name=["--port", "-p"])] = 8080) -> None:
+    """Launch the A-Team Reflection web dashboard."""
+    _call("web", port)
+
+
+@app.command
+def dash() -> None:
+    """Launch the real-time Mission Control dashboard."""
+    _call("dash")
+
+
+@app.command
+def spawn(template: str, name: str) -> None:
+    """
+    Spawn a new project from a team-approved template.
+
+    Parameters
+    ----------
+    template
+        Template name (python-web, cli-app, security-hardened)
+    name
+        Project directory name
+    """
+    _call("spawn", template, name)
+
+
+def run() -> None:
+    """Entry point for the fast CLI."""
+    app()
@@ -5,53 +5,311 @@ This module provides the REPL loop for interacting with agents in a room.
 """
 
 import asyncio
+import functools
+import hashlib
+import subprocess
 import sys
-from typing import Optional, List, Dict
-from rich.console import Console
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Optional, List, Dict, Tuple
+from prompt_toolkit import PromptSession
+from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+from prompt_toolkit.completion import WordCompleter
+from prompt_toolkit.history import FileHistory
+from prompt_toolkit.patch_stdout import patch_stdout
+from rich.console import Console, Group, RenderableType
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.status import Status
+from rich.prompt import Confirm, Prompt
 from rich.text import Text
 
-from ateam.core import RoomManager, HistoryManager, AgentRouter, ConfigManager, ContextManager, WorkspaceIndexer
+from ateam.core import AgentRouter, ConfigManager, ContextManager, WorkspaceIndexer, AgentConfig, Message
+from ateam.core import get_config_manager, get_room_manager
+from ateam.providers import BaseProvider
 from ateam.security import SecureAPIKeyManager, InputValidator, TrustManager, ShadowCritic
 from ateam.tools.manager import ToolManager
-from rich.layout import Layout
-from ateam.utils.diff_viewer import DiffViewer
-from ateam.utils.exporter import ManifestExporter
 import os
 
+# Messages sent as context per turn, and how many recent ones are kept in memory
+_CONTEXT_MESSAGES = 50
+_RECENT_MAX = 256
+
+# Bound on cached system prompts (see ChatInterface._get_agent_prompt)
+_PROMPT_CACHE_MAX = 64
+
+# Concurrent Shadow Critic audits, and how many audited actions are remembered
+# so identical ones are not sent again
+_AUDIT_CONCURRENCY = 2
+_AUDIT_SEEN_MAX = 256
+
+# Room metadata changes are coalesced and flushed this many seconds after the
+# first one (and immediately on exit/clear/switch)
+_METADATA_FLUSH_DELAY = 5.0
+
+# Streaming output is rendered as a plain-text tail, redrawn at most every
+# 100ms (or every 64 new characters); Markdown is parsed once on completion.
+_STREAM_RENDER_INTERVAL = 0.1
+_STREAM_RENDER_CHARS = 64
+_STREAM_TAIL_CHARS = 2000
+
+_PROVIDER_STYLES = {
+    "gemini": "cyan",
+    "openai": "green",
+    "anthropic": "yellow",
+    "ollama": "blue"
+}
+
+_HELP_TEXT = """
+[bold cyan]Available Commands:[/bold cyan]
+- [bold]/help[/bold]: Show this help message
+- [bold]/exit[/bold], [bold]/leave[/bold]: Leave the room and exit the session
+- [bold]/switch <room>[/bold]: Switch to a different room
+- [bold]/status[/bold]: Show current room and agent information
+- [bold]/history[/bold]: Show conversation history (last 50 messages)
+- [bold]/refresh[/bold]: Re-scan workspace for improved context
+- [bold]/web[/bold]: Launch the Web Reflection dashboard
+- [bold]/export[/bold]: Export mission history to a Markdown manifest
+- [bold]/clear[/bold]: Clear history in this room (irreversible!)
+- [bold]/agents[/bold]: List available agents
+- [bold]/agent <name>[/bold]: Switch default agent for this session
+- [bold]/trust [@agent] [minutes][/bold]: Grant temporary auto-execution trust
+- [bold]/untrust [@agent][/bold]: Revoke trust immediately
+            """
+_HELP_PANEL = Panel(_HELP_TEXT, title="Help")
+
+# Slash command -> ChatInterface._cmd_<handler>; aliases share a handler
+_COMMANDS = {
+    "exit": "exit",
+    "quit": "exit",
+    "q": "exit",
+    "leave": "exit",
+    "help": "help",
+    "status": "status",
+    "switch": "switch",
+    "history": "history",
+    "refresh": "refresh",
+    "web": "web",
+    "export": "export",
+    "clear": "clear",
+    "agents": "agents",
+    "agent": "agent",
+    "trust": "trust",
+    "untrust": "untrust",
+}
+
+_STATUS_TEMPLATE = """
+[bold cyan]Room:[/bold cyan] {room}
+[bold cyan]Description:[/bold cyan] {description}
+[bold cyan]Messages:[/bold cyan] {messages}
+[bold cyan]Default Agent:[/bold cyan] [magenta]@{agent}[/magenta]
+[bold cyan]Config Path:[/bold cyan] {config_path}
+            """
+
+
+def _read_or_empty(path: str) -> str:
+    """Current content of a file about to be written, or "" if it doesn't exist."""
+    if not os.path.exists(path):
+        return ""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=512)
+def _render_markdown(content: str) -> Markdown:
+    """Parse message content once; the parsed renderable is reused on replay."""
+    return Markdown(content)
+
 
 class ChatInterface:
     """
     Manages the interactive chat session in a room.
     """
 
-    def __init__(self, room_name: str, console: Optional[Console] = None) -> None:
+    def __init__(
+        self,
+        room_name: str,
+        console: Optional[Console] = None,
+        config_manager: Optional[ConfigManager] = None,
+        tool_manager: Optional[ToolManager] = None
+    ) -> None:
         self.room_name = room_name
         self.console = console or Console()
         self.validator = InputValidator()
         self.key_manager = SecureAPIKeyManager()
         
         # Core components
-        self.room_manager = RoomManager()
+        self.room_manager = get_room_manager()
         self.history_manager = self.room_manager.get_history(room_name)
-        self.config_manager = ConfigManager()
+        self.transcript = self.room_manager.get_transcript(room_name)
+        self.config_manager = config_manager or get_config_manager()
         self.router = AgentRouter(self.config_manager)
-        self.tool_manager = ToolManager()
+        self.tool_manager = tool_manager or ToolManager()
         self.trust_manager = TrustManager()
-        self.indexer = WorkspaceIndexer()
-        self.indexer.refresh() # Initial scan
-        self.shadow_critic = ShadowCritic(self.config_manager, self.console)
+        # Start from the persisted index; run() re-scans in the background
+        self.indexer = WorkspaceIndexer(cache_path=WorkspaceIndexer.default_cache_path())
+        self.indexer.load_cached()
+        self._index_task: Optional[asyncio.Future] = None
+
+        # Agent configs are immutable for the lifetime of a session
+        self._get_agent_cfg = functools.lru_cache(maxsize=None)(self.config_manager.get_agent)
+
+        # Messages not yet added to the room's stored count, flushed lazily
+        self._pending_messages = 0
+        self._flush_task: Optional[asyncio.Task] = None
         
         # State
         self.current_agent = self.config_manager.config.default_agent
         self.should_exit = False
 
+        # Async prompt session (created on first prompt, needs a terminal)
+        self._session: Optional[PromptSession] = None
+        self._prompt_text = [("bold ansigreen", f" {self.room_name} ❯ ")]
+
+        # User message not yet persisted (see _process_message)
+        self._pending_user: Optional[str] = None
+
+        # (agent, input) turns queued to analyze tool results, run after the current turn
+        self._followups: "deque[Tuple[str, str]]" = deque()
+
+        # Resolved API keys per provider
+        self._key_cache: Dict[str, str] = {}
+
+        # Assembled system prompts per (agent, config version, index version)
+        self._prompt_cache: "OrderedDict[tuple, Tuple[str, ContextManager, int]]" = OrderedDict()
+
+        # Provider instances per agent, reused for the whole session
+        self._provider_cache: Dict[str, BaseProvider] = {}
+
+        # Recent room messages as provider dicts, shared by every agent's window.
+        # `_recent_seq` counts all appends; `_recent_last_id` is the newest row seen.
+        self._recent: deque = deque(maxlen=_RECENT_MAX)
+        self._recent_seq = 0
+        self._recent_last_id = 0
+
+        # Trimmed window of the agent that spoke last; "seq" is the ring position it covers
+        self._ctx_cache = {"agent": None, "seq": 0, "msgs": [], "tokens": 0}
+
+        # Bound command handlers, looked up by name in _handle_command
+        self._commands = {name: getattr(self, f"_cmd_{handler}") for name, handler in _COMMANDS.items()}
+
+        # Background audits: bounded concurrency, deduplicated by action/result digest
+        self._audit_sem = asyncio.Semaphore(_AUDIT_CONCURRENCY)
+        self._audit_seen: "OrderedDict[bytes, None]" = OrderedDict()
+        self._audit_tasks: set = set()
+
+    @classmethod
+    async def create(cls, room_name: str, console: Optional[Console] = None) -> "ChatInterface":
+        """
+        Create a chat interface, loading the config and tool plugins concurrently.
+
+        Args:
+            room_name: Name of the room to chat in
+            console: Optional console to render to
+
+        Returns:
+            Ready-to-run ChatInterface
+        """
+        config_manager, tool_manager = await asyncio.gather(
+            asyncio.to_thread(get_config_manager),
+            asyncio.to_thread(ToolManager)
+        )
+        return cls(room_name, console, config_manager=config_manager, tool_manager=tool_manager)
+
+    @functools.cached_property
+    def shadow_critic(self) -> ShadowCritic:
+        """Background auditor, only needed once a tool has been executed."""
+        return ShadowCritic(self.config_manager, self.console)
+
+    async def _flush_metadata(self) -> None:
+        """Add the pending messages to the room's stored message count."""
+        count = self._pending_messages
+        if not count:
+            return
+        self._pending_messages = 0
+        try:
+            await asyncio.to_thread(self.room_manager.add_message_count, self.room_name, count)
+        except Exception:
+            self._pending_messages += count
+            raise
+
+    def _schedule_flush(self) -> None:
+        """Start (once) a delayed background flush of the pending message count."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(_METADATA_FLUSH_DELAY)
+        try:
+            await self._flush_metadata()
+        except Exception as e:
+            # The count stays pending and is retried on the next flush
+            self.console.print(f"[dim]Warning: could not save room metadata: {e}[/dim]")
+
+    def _schedule_audit(self, agent_name: str, action: str, result: str, context: str) -> None:
+        """Start a background Shadow Critic audit unless this exact action was already audited."""
+        key = hashlib.blake2b(f"{agent_name}|{action}|{result}".encode(), digest_size=16).digest()
+        if key in self._audit_seen:
+            return
+        self._audit_seen[key] = None
+        if len(self._audit_seen) > _AUDIT_SEEN_MAX:
+            self._audit_seen.popitem(last=False)
+
+        task = asyncio.create_task(self._audit(agent_name, action, result, context))
+        self._audit_tasks.add(task)
+        task.add_done_callback(self._audit_tasks.discard)
+
+    async def _audit(self, agent_name: str, action: str, result: str, context: str) -> None:
+        async with self._audit_sem:
+            await self.shadow_critic.audit_action(
+                agent_name=agent_name,
+                action=action,
+                result=result,
+                context=context
+            )
+
+    def _reset_context_cache(self) -> None:
+        """Drop the cached context window."""
+        self._ctx_cache = {"agent": None, "seq": 0, "msgs": [], "tokens": 0}
+
+    def _reset_recent(self) -> None:
+        """Forget the in-memory history (e.g. after /clear or /switch)."""
+        self._recent.clear()
+        self._recent_last_id = 0
+        self._reset_context_cache()
+
+    def _extend_recent(self, msgs: List[Dict[str, str]], last_id: int) -> None:
+        self._recent.extend(msgs)
+        self._recent_seq += len(msgs)
+        self._recent_last_id = last_id
+
+    def _record(self, stored: List[Message]) -> bool:
+        """
+        Mirror messages this session just stored into the transcript and the
+        in-memory history.
+
+        Every stored message reaches the transcript. The in-memory copy is
+        skipped when another writer inserted rows in between; the next turn's
+        delta query then picks up both in order.
+        """
+        for m in stored:
+            self.transcript.append(m.role, m.content, m.agent_tag)
+        if not stored or stored[0].id != self._recent_last_id + 1:
+            return False
+        self._extend_recent(
+            [{"role": "assistant" if m.role == "assistant" else "user", "content": m.content} for m in stored],
+            stored[-1].id
+        )
+        return True
+
     def _resolve_api_key(self, provider: str) -> str:
         """Resolve API key using our secure manager."""
+        # Keyring lookups are slow (D-Bus on Linux), so resolved keys are kept for the session
+        key = self._key_cache.get(provider)
+        if key:
+            return key
+
         # Try to get from keyring/env
         key = self.key_manager.get_key(provider)
         if not key:
@@ -59,25 +317,42 @@ class ChatInterface:
             self.console.print(f"[bold red]Error:[/bold red] API key for [yellow]{provider}[/yellow] ({env_var}) not found.")
             self.console.print(f"Please set it using: [cyan]ateam init[/cyan] or export it to [bold]{env_var}[/bold].")
             return ""
+        self._key_cache[provider] = key
         return key
 
+    def _create_session(self) -> PromptSession:
+        """Prompt with persistent input history and completion of /commands and @agents."""
+        words = [f"/{name}" for name in self._commands]
+        words += [f"@{name}" for name in self.config_manager.config.agents]
+        return PromptSession(
+            history=FileHistory(str(self.room_manager.base_dir.parent / "repl_history")),
+            auto_suggest=AutoSuggestFromHistory(),
+            completer=WordCompleter(words, WORD=True),
+        )
+
     async def run(self) -> None:
         """Main REPL loop."""
         self.console.print(f"\n[bold cyan]Entering Room:[/bold cyan] [bold white]{self.room_name}[/bold white]")
         self.console.print(f"[dim]Default Agent: {self.current_agent} | Type /help for commands[/dim]\n")
 
+        # Incremental re-scan overlaps with the user typing
+        self._index_task = asyncio.ensure_future(asyncio.to_thread(self.indexer.refresh))
+
         # Load recent history
-        history = self.history_manager.get_last_messages(limit=10)
-        for msg in reversed(history):
-            self._display_message(msg.role, msg.content, msg.agent_tag)
+        history = [
+            self._render_message(*row)
+            for row in self.history_manager.iter_display_rows(limit=10, newest_first=True)
+        ]
+        if history:
+            self.console.print(Group(*history))
 
         while not self.should_exit:
             try:
-                # Use asyncio.to_thread for blocking input
-                user_input = await asyncio.to_thread(
-                    Prompt.ask, 
-                    Text(f" {self.room_name} ❯ ", style="bold green")
-                )
+                # prompt_toolkit integrates with the event loop, no worker thread per turn
+                if self._session is None:
+                    self._session = self._create_session()
+                with patch_stdout():
+                    user_input = await self._session.prompt_async(self._prompt_text)
                 
                 if not user_input.strip():
                     continue
@@ -100,106 +375,216 @@ class ChatInterface:
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Use /exit to leave the room safely.[/yellow]")
 
-    def _display_message(self, role: str, content: str, agent_tag: Optional[str] = None) -> None:
-        """Render a message to the console."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        await self._flush_metadata()
+        self.transcript.close()
+        self.history_manager.close()
+
+    def _render_message(self, role: str, content: str, agent_tag: Optional[str] = None) -> RenderableType:
+        """Build the renderable for a message, so callers can batch several into one print."""
         if role == "user":
-            self.console.print(f"\n[bold green]You[/bold green]")
-            self.console.print(content)
+            return Group(Text("\nYou", style="bold green"), Text(content))
         elif role == "assistant":
             name = agent_tag or "AI"
-            self.console.print(f"\n[bold magenta]@{name}[/bold magenta]")
-            self.console.print(Markdown(content))
+            return Group(Text(f"\n@{name}", style="bold magenta"), _render_markdown(content))
         elif role == "system":
-            self.console.print(f"\n[bold yellow]System[/bold yellow]")
-            self.console.print(f"[italic]{content}[/italic]")
+            return Group(Text("\nSystem", style="bold yellow"), Text(content, style="italic"))
+        return Text("")
+
+    def _get_agent_prompt(self, agent_name: str, agent_cfg: AgentConfig) -> Tuple[str, ContextManager, int]:
+        """
+        Get the agent's full system prompt, its ContextManager and the prompt's token count.
+
+        Cached per agent until the config is reloaded or the workspace is re-indexed.
+        """
+        key = (agent_name, self.config_manager.version, self.indexer.version)
+        entry = self._prompt_cache.get(key)
+        if entry is not None:
+            self._prompt_cache.move_to_end(key)
+            return entry
+
+        # Prepare Enhanced System Prompt (Team Knowledge + Tools + Workspace Index)
+        team_summary = self.config_manager.get_team_summary()
+        tools_info = self.tool_manager.get_tool_descriptions()
+        workspace_info = self.indexer.get_summary()
+        
+        full_system_prompt = (
+            f"{agent_cfg.system_prompt}\n\n"
+            f"{team_summary}\n\n"
+            f"### [AUTO-CONTEXT] WORKSPACE OVERVIEW\n"
+            f"{workspace_info}\n\n"
+            f"{tools_info}"
+        )
+        ctx_mgr = ContextManager(max_tokens=agent_cfg.max_tokens)
+
+        entry = (full_system_prompt, ctx_mgr, ctx_mgr.count_tokens(full_system_prompt))
+        self._prompt_cache[key] = entry
+        if len(self._prompt_cache) > _PROMPT_CACHE_MAX:
+            self._prompt_cache.popitem(last=False)
+        return entry
 
     async def _process_message(self, text: str) -> None:
         """Route message to agents and handle responses sequentially."""
         # Detect agents (plural)
         agent_names, cleaned_text = self.router.select_agents(text)
         
-        # Save user message once
-        self.history_manager.add_message(role="user", content=text, agent_tag=None)
-
-        for i, agent_name in enumerate(agent_names):
-            self.current_agent = agent_name
-            
-            # Execute turn for this agent
-            await self._run_single_agent_turn(agent_name, text)
+        # The user message is written together with the first reply
+        self._pending_user = text
+        try:
+            for i, agent_name in enumerate(agent_names):
+                self.current_agent = agent_name
+
+                # Execute turn for this agent, then any tool-result analyses it queued
+                await self._run_single_agent_turn(agent_name, text)
+                while self._followups:
+                    await self._run_single_agent_turn(*self._followups.popleft())
+        finally:
+            self._followups.clear()
+            # No reply was stored (error or missing key): save the user message alone
+            if self._pending_user is not None:
+                self._pending_user = None
+                self._record([self.history_manager.add_message(role="user", content=text, agent_tag=None)])
+                self._reset_context_cache()
 
     async def _run_single_agent_turn(self, agent_name: str, user_input: str) -> None:
         """Execute a single agent's turn in the conversation."""
         try:
-            agent_cfg = self.config_manager.get_agent(agent_name)
-            api_key = self._resolve_api_key(agent_cfg.provider)
-            if not api_key:
-                return
+            agent_cfg = self._get_agent_cfg(agent_name)
 
-            provider = self.router.get_provider_for_agent(agent_name, api_key)
-            
-            # Prepare context
-            # Get history in chronological order
-            full_history = self.history_manager.get_history(limit=50) 
-            msgs_for_llm = []
-            for m in full_history:
-                # Map roles: 'assistant' -> 'assistant', 'user' -> 'user', 'system' -> 'user' (for providers)
-                role = "assistant" if m.role == "assistant" else "user"
-                msgs_for_llm.append({"role": role, "content": m.content})
-
-            # Prepare Enhanced System Prompt (Team Knowledge + Tools + Workspace Index)
-            team_summary = self.config_manager.get_team_summary()
-            tools_info = self.tool_manager.get_tool_descriptions()
-            workspace_info = self.indexer.get_summary()
-            
-            full_system_prompt = (
-                f"{agent_cfg.system_prompt}\n\n"
-                f"{team_summary}\n\n"
-                f"### [AUTO-CONTEXT] WORKSPACE OVERVIEW\n"
-                f"{workspace_info}\n\n"
-                f"{tools_info}"
+            # Only rows written by other sessions are read back; this session's
+            # own messages are already in memory. Overlap it with the key lookup,
+            # which is skipped entirely once the agent's provider exists.
+            history_task = asyncio.to_thread(
+                self.history_manager.get_context_dicts, _CONTEXT_MESSAGES, self._recent_last_id
             )
+            provider = self._provider_cache.get(agent_name)
+            if provider is not None:
+                rows, last_id = await history_task
+            else:
+                if agent_cfg.provider in self._key_cache:
+                    api_key = self._key_cache[agent_cfg.provider]
+                    rows, last_id = await history_task
+                else:
+                    api_key, (rows, last_id) = await asyncio.gather(
+                        asyncio.to_thread(self._resolve_api_key, agent_cfg.provider),
+                        history_task
+                    )
+                if not api_key:
+                    return
+                provider = self._provider_cache.setdefault(
+                    agent_name, self.router.get_provider_for_agent(agent_name, api_key)
+                )
 
-            # Trim context
-            ctx_mgr = ContextManager(max_tokens=agent_cfg.max_tokens)
-            trimmed_msgs = ctx_mgr.get_trimmed_context(
-                msgs_for_llm, 
-                system_prompt=full_system_prompt
+            if rows:
+                if len(rows) >= _CONTEXT_MESSAGES:
+                    # Older unseen rows may be missing; start over from these
+                    self._reset_recent()
+                self._extend_recent(rows, last_id)
+
+            # Reuse the agent's window if it spoke last, else rebuild from memory
+            cache = self._ctx_cache
+            unseen = self._recent_seq - cache["seq"]
+            if cache["agent"] != agent_name or unseen > len(self._recent):
+                self._reset_context_cache()
+                cache = self._ctx_cache
+                unseen = min(len(self._recent), _CONTEXT_MESSAGES)
+            new_msgs = list(islice(self._recent, len(self._recent) - unseen, None))
+            
+            # Without a persisted index, wait for the first scan
+            if not self.indexer.index and self._index_task is not None:
+                await self._index_task
+            full_system_prompt, ctx_mgr, system_tokens = self._get_agent_prompt(agent_name, agent_cfg)
+
+            # Trim context incrementally: only messages newer than the cached
+            # window are tokenized.
+            pending_user = self._pending_user
+            if pending_user is not None:
+                new_msgs.append({"role": "user", "content": pending_user})
+            window, window_tokens = ctx_mgr.append_and_trim(
+                cache["msgs"],
+                cache["tokens"],
+                new_msgs,
+                system_prompt=full_system_prompt,
+                max_messages=_CONTEXT_MESSAGES
             )
+            cache.update(agent=agent_name, seq=self._recent_seq, msgs=window, tokens=window_tokens)
+
+            # The system prompt goes only through `system_prompt`, and the window
+            # keeps older turns verbatim in order, so consecutive requests share
+            # an exact prefix for provider-side prompt caching.
+            trimmed_msgs = list(window)
+            trimmed_tokens = window_tokens + 3 + system_tokens
 
             # Display "Thinking..."
-            provider_style = {
-                "gemini": "cyan",
-                "openai": "green",
-                "anthropic": "yellow",
-                "ollama": "blue"
-            }.get(agent_cfg.provider.lower(), "magenta")
+            provider_style = _PROVIDER_STYLES.get(agent_cfg.provider.lower(), "magenta")
             
             self.console.print(f"\n[bold {provider_style}]@{agent_name}[/bold {provider_style}] [dim]({agent_cfg.provider}/{agent_cfg.model})[/dim]")
             
-            full_response = ""
-            with Live(Text("Thinking...", style="italic dim"), refresh_per_second=10) as live:
+            # Chunks are collected in a list and joined once at the end; the
+            # live tail is drawn from a small ring of the most recent chunks.
+            chunks: List[str] = []
+            tail: deque = deque()
+            tail_len = 0
+            received = 0
+            last_render = time.monotonic()
+            rendered_len = 0
+            # Redraws are driven by the stream, not by Live's refresh thread
+            with Live(Text("Thinking...", style="italic dim"), console=self.console, auto_refresh=False) as live:
                 try:
                     # Use streaming if supported
                     async for chunk in provider.stream(trimmed_msgs, system_prompt=full_system_prompt):
-                        full_response += chunk
-                        live.update(Markdown(full_response))
+                        chunks.append(chunk)
+                        tail.append(chunk)
+                        tail_len += len(chunk)
+                        while tail_len - len(tail[0]) >= _STREAM_TAIL_CHARS:
+                            tail_len -= len(tail.popleft())
+                        received += len(chunk)
+                        now = time.monotonic()
+                        if (now - last_render >= _STREAM_RENDER_INTERVAL
+                                or received - rendered_len >= _STREAM_RENDER_CHARS):
+                            live.update(Text("".join(tail)[-_STREAM_TAIL_CHARS:]), refresh=True)
+                            last_render = now
+                            rendered_len = received
+                    full_response = "".join(chunks)
                 except NotImplementedError:
                     # Fallback to non-streaming
                     response = await provider.complete(trimmed_msgs, system_prompt=full_system_prompt)
                     full_response = response.content
-                    live.update(Markdown(full_response))
 
-            # Store result
-            self.history_manager.add_message(
-                role="assistant", 
-                content=full_response, 
-                agent_tag=agent_name
-            )
+                # Parse Markdown once the response is complete
+                live.update(_render_markdown(full_response), refresh=True)
+
+            # Store result (with the pending user message, in one transaction)
+            if pending_user is not None:
+                self._pending_user = None
+                stored = self.history_manager.add_messages([
+                    ("user", pending_user, None),
+                    ("assistant", full_response, agent_name),
+                ])
+            else:
+                stored = [self.history_manager.add_message(
+                    role="assistant", 
+                    content=full_response, 
+                    agent_tag=agent_name
+                )]
+
+            # The reply is already known; append it to the cached window directly
+            if self._record(stored):
+                msgs, tokens = ctx_mgr.append_and_trim(
+                    cache["msgs"],
+                    cache["tokens"],
+                    [{"role": "assistant", "content": full_response}],
+                    system_prompt=full_system_prompt,
+                    max_messages=_CONTEXT_MESSAGES
+                )
+                cache.update(seq=self._recent_seq, msgs=msgs, tokens=tokens)
+            else:
+                self._reset_context_cache()
 
             # --- Tool Call Handling ---
             tool_calls = self.tool_manager.parse_calls(full_response)
             for call_info in tool_calls:
-                from rich.prompt import Confirm
                 tool_name = call_info["name"]
                 
                 self.console.print(Panel(
@@ -213,17 +598,17 @@ class ChatInterface:
                 
                 should_execute = False
                 
-                # Check for write_file to show diff
+                # Check for write_file to show diff; reading the old file and
+                # diffing it happen off the event loop
                 if tool_name == "write_file" and not is_trusted:
                     path = call_info["args"].get("path")
-                    new_content = call_info["body"]
                     if path:
-                        old_content = ""
-                        if os.path.exists(path):
-                            with open(path, "r", encoding="utf-8") as f:
-                                old_content = f.read()
-                        
-                        DiffViewer.show_diff(self.console, path, old_content, new_content)
+                        from ateam.utils.diff_viewer import DiffViewer
+                        old_content = await asyncio.to_thread(_read_or_empty, path)
+                        for renderable in await asyncio.to_thread(
+                            DiffViewer.build_diff, path, old_content, call_info["body"]
+                        ):
+                            self.console.print(renderable)
 
                 if is_trusted:
                     self.console.print(f"[bold green]✓ Agent @{agent_name} is TRUSTED. Auto-executing...[/bold green]")
@@ -233,6 +618,7 @@ class ChatInterface:
                 
                 if should_execute:
                     # Cinematic Layout for Tool Execution
+                    from rich.layout import Layout
                     layout = Layout()
                     layout.split_row(
                         Layout(Panel(Markdown(full_response), title="Conversation Context", border_style="dim"), ratio=1),
@@ -245,42 +631,42 @@ class ChatInterface:
                         layout["action"].update(Panel(result, title=f"✅ {tool_name} Result", border_style="green"))
                     
                     # Store tool result in history
-                    self.history_manager.add_message(
+                    self._record([self.history_manager.add_message(
                         role="system", 
                         content=f"Tool '{tool_name}' result:\n{result}",
                         agent_tag="system"
-                    )
+                    )])
 
                     # Trigger Shadow Critic Audit (Background)
-                    asyncio.create_task(self.shadow_critic.audit_action(
-                        agent_name=agent_name,
-                        action=f"Tool: {tool_name}, Args: {call_info['args']}, Body: {call_info['body']}",
-                        result=result,
-                        context=f"Request: [User Input]\nResponse: {full_response}" 
-                    ))
+                    self._schedule_audit(
+                        agent_name,
+                        f"Tool: {tool_name}, Args: {call_info['args']}, Body: {call_info['body']}",
+                        result,
+                        f"Request: [User Input]\nResponse: {full_response}"
+                    )
                     
                     if Confirm.ask(f"Let [bold magenta]@{agent_name}[/bold magenta] analyze the result?", default=True):
-                        # Recursive call for tool analysis
-                        # Note: We are already inside _run_single_agent_turn, so we call it again for the SAME agent
-                        await self._run_single_agent_turn(agent_name, user_input)
+                        # Queued rather than recursing: chained tool calls then don't
+                        # nest turns (and their Live displays) on the stack
+                        self._followups.append((agent_name, user_input))
                         return 
                 else:
                     self.console.print(f"[red]✗ Execution denied for {tool_name}.[/red]")
             
             # Show stats if enabled in config
             if self.config_manager.config.show_token_usage:
-                usage = ctx_mgr.get_token_usage(trimmed_msgs + [{"role": "assistant", "content": full_response}])
-                self.console.print(f"[dim]Tokens: {usage['total_tokens']} / {usage['max_tokens']} ({usage['usage_percent']}%)[/dim]")
+                # Reuse the trimmed context count; only the response is estimated
+                total = trimmed_tokens + ctx_mgr.count_tokens(full_response)
+                percent = int((total / ctx_mgr.max_tokens) * 100) if ctx_mgr.max_tokens > 0 else 0
+                self.console.print(f"[dim]Tokens: {total} / {ctx_mgr.max_tokens} ({percent}%)[/dim]")
 
             # Update room metadata
-            metadata = self.room_manager._load_metadata(self.room_name)
-            metadata.message_count += 2 # User + AI (approx)
-            self.room_manager._save_metadata(self.room_name, metadata)
+            self._pending_messages += 2 # User + AI (approx)
+            self._schedule_flush()
 
             # --- Agent Handoff Detection ---
             suggested_agent = self.router.detect_handoff(full_response, agent_name)
             if suggested_agent:
-                from rich.prompt import Confirm
                 self.console.print(f"\n[bold yellow]➔ Handoff Suggestion:[/bold yellow] [magenta]@{agent_name}[/magenta] suggested [cyan]@{suggested_agent}[/cyan]")
                 if Confirm.ask(f"Switch default agent to [bold cyan]@{suggested_agent}[/bold cyan]?", default=True):
                     self.current_agent = suggested_agent
@@ -293,129 +679,132 @@ class ChatInterface:
         """Handle internal /commands."""
         parts = cmd_line.split()
         cmd = parts[0].lower()
-        
-        if cmd in ("exit", "quit", "q", "leave"):
-            self.should_exit = True
-            self.console.print("[dim]Leaving room...[/dim]")
-        
-        elif cmd == "help":
-            help_text = """
-[bold cyan]Available Commands:[/bold cyan]
-- [bold]/help[/bold]: Show this help message
-- [bold]/exit[/bold], [bold]/leave[/bold]: Leave the room and exit the session
-- [bold]/switch <room>[/bold]: Switch to a different room
-- [bold]/status[/bold]: Show current room and agent information
-- [bold]/history[/bold]: Show conversation history (last 50 messages)
-- [bold]/refresh[/bold]: Re-scan workspace for improved context
-- [bold]/web[/bold]: Launch the Web Reflection dashboard
-- [bold]/export[/bold]: Export mission history to a Markdown manifest
-- [bold]/clear[/bold]: Clear history in this room (irreversible!)
-- [bold]/agents[/bold]: List available agents
-- [bold]/agent <name>[/bold]: Switch default agent for this session
-- [bold]/trust [@agent] [minutes][/bold]: Grant temporary auto-execution trust
-- [bold]/untrust [@agent][/bold]: Revoke trust immediately
-            """
-            self.console.print(Panel(help_text, title="Help"))
-
-        elif cmd == "status":
-            metadata = self.room_manager._load_metadata(self.room_name)
-            status_text = f"""
-[bold cyan]Room:[/bold cyan] {self.room_name}
-[bold cyan]Description:[/bold cyan] {metadata.description or "None"}
-[bold cyan]Messages:[/bold cyan] {metadata.message_count}
-[bold cyan]Default Agent:[/bold cyan] [magenta]@{self.current_agent}[/magenta]
-[bold cyan]Config Path:[/bold cyan] {self.config_manager.config_path}
-            """
-            self.console.print(Panel(status_text, title="📊 Room Status"))
 
-        elif cmd == "switch":
-            if len(parts) > 1:
-                new_room = parts[1]
-                try:
-                    self.validator.validate_room_name(new_room)
-                    # Join the new room
-                    self.room_name = new_room
-                    self.history_manager = self.room_manager.get_history(new_room)
-                    self.room_manager.join_room(new_room)
-                    
-                    self.console.print(f"\n[bold green]✓[/bold green] Switched to room: [bold cyan]{new_room}[/bold cyan]\n")
-                    
-                    # Display history of new room
-                    history = self.history_manager.get_last_messages(limit=5)
-                    if history:
-                        self.console.print("[dim]Recent context:[/dim]")
-                        for msg in reversed(history):
-                            self._display_message(msg.role, msg.content, msg.agent_tag)
-                            
-                except ValueError as e:
-                    self.console.print(f"[red]✗ Invalid room name:[/red] {e}")
-            else:
-                self.console.print("[yellow]Usage: /switch <room_name>[/yellow]")
-            
-        elif cmd == "history":
-            history = self.history_manager.get_history(limit=50)
-            self.console.print("\n[bold cyan]--- History ---[/bold cyan]")
-            for msg in reversed(history):
-                self._display_message(msg.role, msg.content, msg.agent_tag)
-            self.console.print("[bold cyan]--- End ---[/bold cyan]\n")
-
-        elif cmd == "refresh":
-            with self.console.status("[bold yellow]Re-indexing workspace...[/bold yellow]"):
-                self.indexer.refresh()
-            self.console.print("[bold green]✓ Workspace index refreshed.[/bold green]")
-
-        elif cmd == "web":
-            import subprocess
-            import sys
-            # Start in a new process so it doesn't block the chat
-            subprocess.Popen([sys.executable, "-m", "ateam.cli.main", "web"], 
-                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            self.console.print("[bold green]🚀 Web Reflection launched at http://localhost:8080[/bold green]")
-
-        elif cmd == "export":
-            history = self.history_manager.get_history(limit=1000) # Fetch all
-            path = ManifestExporter.export(self.room_name, history)
-            self.console.print(f"[bold green]✓ Mission Manifest exported to:[/bold green] [cyan]{path}[/cyan]")
+        handler = self._commands.get(cmd)
+        if handler is None:
+            self.console.print(f"[yellow]Unknown command: /{cmd}[/yellow]")
+            return
+        await handler(parts)
+
+    async def _cmd_exit(self, _parts: List[str]) -> None:
+        self.should_exit = True
+        await self._flush_metadata()
+        self.console.print("[dim]Leaving room...[/dim]")
+
+    async def _cmd_help(self, _parts: List[str]) -> None:
+        self.console.print(_HELP_PANEL)
+
+    async def _cmd_status(self, _parts: List[str]) -> None:
+        # Read fresh: other sessions may have changed the room meanwhile
+        metadata = await asyncio.to_thread(self.room_manager.get_room_metadata, self.room_name)
+        status_text = _STATUS_TEMPLATE.format(
+            room=self.room_name,
+            description=metadata.description or "None",
+            messages=metadata.message_count + self._pending_messages,
+            agent=self.current_agent,
+            config_path=self.config_manager.config_path,
+        )
+        self.console.print(Panel(status_text, title="📊 Room Status"))
+
+    async def _cmd_switch(self, parts: List[str]) -> None:
+        if len(parts) <= 1:
+            self.console.print("[yellow]Usage: /switch <room_name>[/yellow]")
+            return
+
+        new_room = parts[1]
+        try:
+            self.validator.validate_room_name(new_room)
+            # Persist the old room before leaving it
+            await self._flush_metadata()
+
+            # Join the new room
+            self.room_manager.join_room(new_room)
+            self.room_name = new_room
+            self._prompt_text = [("bold ansigreen", f" {self.room_name} ❯ ")]
+            self.history_manager.close()
+            self.history_manager = self.room_manager.get_history(new_room)
+            self.transcript.close()
+            self.transcript = self.room_manager.get_transcript(new_room)
+            self._reset_recent()
             
-        elif cmd == "clear":
-            if Prompt.ask("[red]Are you sure you want to clear history?[/red]", choices=["y", "n"]) == "y":
-                self.history_manager.clear_history()
-                # Reset room counter
-                metadata = self.room_manager._load_metadata(self.room_name)
-                metadata.message_count = 0
-                self.room_manager._save_metadata(self.room_name, metadata)
-                self.console.print("[green]History cleared.[/green]")
-                
-        elif cmd == "agents":
-            agents = self.config_manager.config.agents.keys()
-            self.console.print(f"Available Agents: [cyan]{', '.join(agents)}[/cyan]")
-            self.console.print(f"Current default: [bold magenta]@{self.current_agent}[/bold magenta]")
+            self.console.print(f"\n[bold green]✓[/bold green] Switched to room: [bold cyan]{new_room}[/bold cyan]\n")
             
-        elif cmd == "agent":
-            if len(parts) > 1:
-                new_agent = parts[1]
-                if new_agent in self.config_manager.config.agents:
-                    self.current_agent = new_agent
-                    self.console.print(f"Default agent switched to [bold magenta]@{new_agent}[/bold magenta]")
-                else:
-                    self.console.print(f"[red]Agent '{new_agent}' not found.[/red]")
+            # Display history of new room
+            history = [
+                self._render_message(*row)
+                for row in self.history_manager.iter_display_rows(limit=5, newest_first=True)
+            ]
+            if history:
+                self.console.print(Group(Text("Recent context:", style="dim"), *history))
+                    
+        except ValueError as e:
+            self.console.print(f"[red]✗ Invalid room name:[/red] {e}")
+
+    async def _cmd_history(self, _parts: List[str]) -> None:
+        self.console.print(Group(
+            Text("\n--- History ---", style="bold cyan"),
+            *(self._render_message(*row)
+              for row in self.history_manager.iter_display_rows(limit=50, newest_first=True)),
+            Text("--- End ---\n", style="bold cyan")
+        ))
+
+    async def _cmd_refresh(self, _parts: List[str]) -> None:
+        with self.console.status("[bold yellow]Re-indexing workspace...[/bold yellow]"):
+            if self._index_task is not None:
+                await self._index_task
+            self.indexer.refresh()
+        self.console.print("[bold green]✓ Workspace index refreshed.[/bold green]")
+
+    async def _cmd_web(self, _parts: List[str]) -> None:
+        # Start in a new process so it doesn't block the chat
+        subprocess.Popen([sys.executable, "-m", "ateam.cli.main", "web"], 
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.console.print("[bold green]🚀 Web Reflection launched at http://localhost:8080[/bold green]")
+
+    async def _cmd_export(self, _parts: List[str]) -> None:
+        from ateam.utils.exporter import ManifestExporter
+        history = self.history_manager.get_history(limit=1000) # Fetch all
+        path = ManifestExporter.export(self.room_name, history)
+        self.console.print(f"[bold green]✓ Mission Manifest exported to:[/bold green] [cyan]{path}[/cyan]")
+
+    async def _cmd_clear(self, _parts: List[str]) -> None:
+        if Prompt.ask("[red]Are you sure you want to clear history?[/red]", choices=["y", "n"]) == "y":
+            self.history_manager.clear_history()
+            self.transcript.clear()
+            self._reset_recent()
+            # Reset room counter
+            self._pending_messages = 0
+            await asyncio.to_thread(self.room_manager.update_room_metadata, self.room_name, message_count=0)
+            self.console.print("[green]History cleared.[/green]")
+
+    async def _cmd_agents(self, _parts: List[str]) -> None:
+        agents = self.config_manager.config.agents.keys()
+        self.console.print(f"Available Agents: [cyan]{', '.join(agents)}[/cyan]")
+        self.console.print(f"Current default: [bold magenta]@{self.current_agent}[/bold magenta]")
+
+    async def _cmd_agent(self, parts: List[str]) -> None:
+        if len(parts) > 1:
+            new_agent = parts[1]
+            if new_agent in self.config_manager.config.agents:
+                self.current_agent = new_agent
+                self.console.print(f"Default agent switched to [bold magenta]@{new_agent}[/bold magenta]")
             else:
-                self.console.print(f"Current default: [bold magenta]@{self.current_agent}[/bold magenta]")
+                self.console.print(f"[red]Agent '{new_agent}' not found.[/red]")
+        else:
+            self.console.print(f"Current default: [bold magenta]@{self.current_agent}[/bold magenta]")
+
+    async def _cmd_trust(self, parts: List[str]) -> None:
+        target = parts[1].lstrip("@") if len(parts) > 1 else self.current_agent
+        minutes = int(parts[2]) if len(parts) > 2 else 10
         
-        elif cmd == "trust":
-            target = parts[1].lstrip("@") if len(parts) > 1 else self.current_agent
-            minutes = int(parts[2]) if len(parts) > 2 else 10
-            
-            if target in self.config_manager.config.agents:
-                self.trust_manager.trust_agent(target, minutes * 60)
-                self.console.print(f"[bold green]✓ Flow State enabled for @{target}.[/bold green] [{minutes} minutes]")
-            else:
-                self.console.print(f"[red]Agent '{target}' not found.[/red]")
+        if target in self.config_manager.config.agents:
+            self.trust_manager.trust_agent(target, minutes * 60)
+            self.console.print(f"[bold green]✓ Flow State enabled for @{target}.[/bold green] [{minutes} minutes]")
+        else:
+            self.console.print(f"[red]Agent '{target}' not found.[/red]")
 
-        elif cmd == "untrust":
-            target = parts[1].lstrip("@") if len(parts) > 1 else self.current_agent
-            self.trust_manager.revoke_trust(target)
-            self.console.print(f"[yellow]Trust revoked for @{target}.[/yellow]")
+    async def _cmd_untrust(self, parts: List[str]) -> None:
+        target = parts[1].lstrip("@") if len(parts) > 1 else self.current_agent
+        self.trust_manager.revoke_trust(target)
+        self.console.print(f"[yellow]Trust revoked for @{target}.[/yellow]")
 
-        else:
-            self.console.print(f"[yellow]Unknown command: /{cmd}[/yellow]")
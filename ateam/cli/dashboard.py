@@ -5,9 +5,16 @@ Interactive Mission Control Dashboard for A-Team CLI.
 import time
 import asyncio
 import os
-import msvcrt # Windows specific
+import sys
+import threading
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import termios
+    import tty
 
 from rich.console import Console
 from rich.live import Live
@@ -15,13 +22,22 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.layout import Layout
 from rich.text import Text
-from rich.progress import Progress, BarColumn, TextColumn
-from rich.columns import Columns
 
 from ateam.core import RoomManager, RoomMetadata
 from ateam.core.history import Message
 
 
+_STATUS_ACTIVE = Text("● ACTIVE", style="bold green")
+_STATUS_IDLE = Text("● IDLE", style="bold yellow")
+_STATUS_ASLEEP = Text("● ASLEEP", style="dim white")
+_NO_ROOMS_PANEL = Panel(Text("No active missions found.", justify="center"), title="📡 Rooms", border_style="blue")
+
+# Token usage bars: 100k tokens is a sensible "full" bar for short sessions
+_BAR_WIDTH = 15
+_BAR_MAX_TOKENS = 100000
+_BARS = [("━" * i, "━" * (_BAR_WIDTH - i)) for i in range(_BAR_WIDTH + 1)]
+
+
 class Dashboard:
     """
     Real-time interactive dashboard for monitoring rooms and agents.
@@ -35,120 +51,226 @@ class Dashboard:
         self.rooms: List[RoomMetadata] = []
         self.running = True
         self.activity_log: List[str] = ["Dashboard initialized."]
+        self._keys: asyncio.Queue[str] = asyncio.Queue()
+        # room -> (history.db signature, tokens, last agent); refreshed only when the db changes
+        self._stats_cache: Dict[str, Tuple[tuple, int, str]] = {}
+
+        # Layout skeleton and panels are built once; frames only swap their contents
+        self._layout = Layout()
+        self._layout.split(
+            Layout(name="upper", size=3),
+            Layout(name="main", ratio=1),
+            Layout(name="lower", size=10)
+        )
+        self._header_panel = Panel(Text(""), border_style="cyan")
+        self._log_panel = Panel(Text(""), title="📟 Activity Feed", border_style="dim")
+        self._layout["upper"].update(self._header_panel)
+        self._layout["lower"].update(self._log_panel)
+        self._table_rows: Optional[list] = None
+        self._log_len = -1
 
-    def _get_room_status(self, last_active_str: str) -> Text:
-        last_active = datetime.fromisoformat(last_active_str)
-        delta = datetime.utcnow() - last_active
+    def _get_room_status(self, last_active_epoch: float, now: float) -> Text:
+        delta = now - last_active_epoch
         
-        if delta.total_seconds() < 600: # 10 minutes
-            return Text("● ACTIVE", style="bold green")
-        elif delta.total_seconds() < 3600: # 1 hour
-            return Text("● IDLE", style="bold yellow")
+        if delta < 600: # 10 minutes
+            return _STATUS_ACTIVE
+        elif delta < 3600: # 1 hour
+            return _STATUS_IDLE
         else:
-            return Text("● ASLEEP", style="dim white")
+            return _STATUS_ASLEEP
 
-    def _get_token_bar(self, tokens: int) -> Progress:
-        progress = Progress(
-            BarColumn(bar_width=15, complete_style="cyan", finished_style="green"),
-            TextColumn("[bold blue]{task.fields[val]}"),
-            auto_refresh=False
+    def _get_room_stats(self, room_name: str) -> Tuple[int, str]:
+        """Token usage and last agent of a room, re-read only when its history changed."""
+        db_path = self.room_manager.get_room_path(room_name) / "history.db"
+        signature = []
+        for path in (db_path, db_path.with_name("history.db-wal")):
+            try:
+                st = os.stat(path)
+                signature.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        signature = tuple(signature)
+
+        cached = self._stats_cache.get(room_name)
+        if cached is not None and cached[0] == signature:
+            return cached[1], cached[2]
+
+        last_agent = "None"
+        tokens = 0
+        try:
+            history = self.room_manager.get_history(room_name)
+            try:
+                tokens = history.get_token_usage()
+                last_msgs = history.get_last_messages(1)
+                if last_msgs:
+                    last_agent = f"@{last_msgs[0].agent_tag}" if last_msgs[0].agent_tag else "User"
+            finally:
+                history.close()
+        except Exception:
+            pass
+
+        self._stats_cache[room_name] = (signature, tokens, last_agent)
+        return tokens, last_agent
+
+    def _get_token_bar(self, tokens: int) -> Text:
+        """Usage bar assembled from precomputed glyphs."""
+        filled = min(_BAR_WIDTH, tokens * _BAR_WIDTH // _BAR_MAX_TOKENS)
+        done, todo = _BARS[filled]
+        return Text.assemble(
+            (done, "green" if filled == _BAR_WIDTH else "cyan"),
+            (todo, "bar.back"),
+            " ",
+            (f"{tokens:,}", "bold blue")
         )
-        # Using 100k as a sensible "full" bar for short sessions, adjust as needed
-        max_val = 100000
-        usage = min(tokens, max_val)
-        progress.add_task("Usage", total=max_val, completed=usage, val=f"{tokens:,}")
-        return progress
-
-    def _generate_layout(self) -> Layout:
-        layout = Layout()
-        layout.split(
-            Layout(name="upper", size=3),
-            Layout(name="main", ratio=1),
-            Layout(name="lower", size=10)
+
+    def _fetch_room_stats(self, room: RoomMetadata) -> Tuple[RoomMetadata, int, str]:
+        try:
+            tokens, last_agent = self._get_room_stats(room.name)
+        except FileNotFoundError:
+            tokens, last_agent = 0, "None"
+        return room, tokens, last_agent
+
+    async def _collect_stats(self) -> List[Tuple[RoomMetadata, int, str]]:
+        """List rooms and fetch their stats concurrently, off the event loop."""
+        self.rooms = await asyncio.to_thread(self.room_manager.list_rooms)
+        return await asyncio.gather(
+            *(asyncio.to_thread(self._fetch_room_stats, room) for room in self.rooms)
         )
+
+    def _render(self, stats: List[Tuple[RoomMetadata, int, str]]) -> Layout:
+        layout = self._layout
         
         # Header
-        layout["upper"].update(Panel(
-            Text.from_markup(f"[bold cyan]A-TEAM MISSION CONTROL[/bold cyan] | [dim]{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/dim]"),
-            border_style="cyan"
-        ))
+        self._header_panel.renderable = Text.from_markup(
+            f"[bold cyan]A-TEAM MISSION CONTROL[/bold cyan] | [dim]{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/dim]"
+        )
         
-        # Main content - Table
-        self.rooms = self.room_manager.list_rooms()
-        if not self.rooms:
-            layout["main"].update(Panel(Text("No active missions found.", justify="center"), title="📡 Rooms", border_style="blue"))
-        else:
-            table = Table(show_header=True, header_style="bold magenta", expand=True, box=None)
-            table.add_column("S", width=2)
-            table.add_column("Status", width=12)
-            table.add_column("Room Name", style="cyan", no_wrap=True)
-            table.add_column("Agent", style="green")
-            table.add_column("Msgs", justify="right")
-            table.add_column("Token Usage", width=25)
-            table.add_column("Last Activity", style="dim")
-
-            for i, room in enumerate(self.rooms):
-                selector = ">" if i == self.selected_index else " "
-                row_style = "bold white on blue" if i == self.selected_index else ""
-                
-                last_agent = "None"
-                tokens = 0
-                try:
-                    history = self.room_manager.get_history(room.name)
-                    tokens = history.get_token_usage()
-                    last_msgs = history.get_last_messages(1)
-                    if last_msgs:
-                        last_agent = f"@{last_msgs[0].agent_tag}" if last_msgs[0].agent_tag else "User"
-                except Exception:
-                    pass
-                
-                table.add_row(
-                    selector,
-                    self._get_room_status(room.last_active),
-                    room.name,
-                    last_agent,
-                    str(room.message_count),
-                    self._get_token_bar(tokens).get_renderable(),
-                    room.last_active[11:19],
-                    style=row_style
-                )
-
-            layout["main"].update(Panel(table, title="📡 Active Missions (Use ↑/↓, Enter to select)", border_style="blue"))
+        # Main content - Table, rebuilt only when a visible cell changed
+        now = time.time()
+        rows = [
+            (
+                ">" if i == self.selected_index else " ",
+                self._get_room_status(room.last_active_epoch, now),
+                room.name,
+                last_agent,
+                str(room.message_count),
+                self._get_token_bar(tokens),
+                room.last_active[11:19],
+            )
+            for i, (room, tokens, last_agent) in enumerate(stats)
+        ]
+        if rows != self._table_rows:
+            self._table_rows = rows
+            if not rows:
+                layout["main"].update(_NO_ROOMS_PANEL)
+            else:
+                table = Table(show_header=True, header_style="bold magenta", expand=True, box=None)
+                table.add_column("S", width=2)
+                table.add_column("Status", width=12)
+                table.add_column("Room Name", style="cyan", no_wrap=True)
+                table.add_column("Agent", style="green")
+                table.add_column("Msgs", justify="right")
+                table.add_column("Token Usage", width=25)
+                table.add_column("Last Activity", style="dim")
+
+                for i, row in enumerate(rows):
+                    row_style = "bold white on blue" if i == self.selected_index else ""
+                    table.add_row(*row, style=row_style)
+
+                layout["main"].update(Panel(table, title="📡 Active Missions (Use ↑/↓, Enter to select)", border_style="blue"))
         
         # Lower Section - Activity Log
-        log_text = Text("\n".join(self.activity_log[-8:]))
-        layout["lower"].update(Panel(log_text, title="📟 Activity Feed", border_style="dim"))
+        if len(self.activity_log) != self._log_len:
+            self._log_len = len(self.activity_log)
+            self._log_panel.renderable = Text("\n".join(self.activity_log[-8:]))
         
         return layout
 
-    def _handle_input(self):
-        if msvcrt.kbhit():
-            key = msvcrt.getch()
-            if key == b'\xe0': # Special key
-                key = msvcrt.getch()
-                if key == b'H': # Up
-                    self.selected_index = max(0, self.selected_index - 1)
-                elif key == b'P': # Down
-                    self.selected_index = min(len(self.rooms) - 1, self.selected_index + 1)
-            elif key.lower() == b'q':
-                self.running = False
-            elif key == b'\r': # Enter
-                if self.rooms:
-                    room = self.rooms[self.selected_index]
-                    self.activity_log.append(f"[{datetime.now().strftime('%H:%M:%S')}] Pinging room: {room.name}")
+    def _handle_input(self, key: str) -> None:
+        if key == "up":
+            self.selected_index = max(0, self.selected_index - 1)
+        elif key == "down":
+            self.selected_index = min(len(self.rooms) - 1, self.selected_index + 1)
+        elif key == "q":
+            self.running = False
+        elif key == "enter":
+            if self.rooms:
+                room = self.rooms[self.selected_index]
+                self.activity_log.append(f"[{datetime.now().strftime('%H:%M:%S')}] Pinging room: {room.name}")
+
+    def _read_keys_windows(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Feed key presses into the queue; runs in a daemon thread.
+
+        getwch blocks until a key arrives, so it is only called once kbhit()
+        reports one, letting the thread notice `running` going False and exit.
+        """
+        while self.running:
+            if not msvcrt.kbhit():
+                time.sleep(0.05)
+                continue
+            key = msvcrt.getwch()
+            if key in ("\x00", "\xe0"): # Special key
+                key = {"H": "up", "P": "down"}.get(msvcrt.getwch(), "")
+            elif key == "\r":
+                key = "enter"
+            try:
+                loop.call_soon_threadsafe(self._keys.put_nowait, key.lower())
+            except RuntimeError:
+                return # the loop has already closed
+
+    def _on_stdin_ready(self) -> None:
+        """Translate raw POSIX terminal input into key names."""
+        data = os.read(sys.stdin.fileno(), 32)
+        if data.startswith(b"\x1b[A"):
+            self._keys.put_nowait("up")
+        elif data.startswith(b"\x1b[B"):
+            self._keys.put_nowait("down")
+        elif data in (b"\r", b"\n"):
+            self._keys.put_nowait("enter")
+        else:
+            self._keys.put_nowait(data.decode(errors="ignore").lower())
 
     async def run(self):
         """Runs the live dashboard."""
         self.console.clear()
-        with Live(self._generate_layout(), console=self.console, refresh_per_second=4, screen=True) as live:
-            try:
-                while self.running:
-                    self._handle_input()
-                    live.update(self._generate_layout())
-                    await asyncio.sleep(0.1)
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                # Basic error logging into the feed if we can
-                self.activity_log.append(f"ERROR: {str(e)}")
-                await asyncio.sleep(2)
+
+        # Keys arrive as events; without input the layout is rebuilt once a second
+        saved_tty = None
+        loop = asyncio.get_running_loop()
+        if os.name == "nt":
+            threading.Thread(target=self._read_keys_windows, args=(loop,), daemon=True).start()
+        elif sys.stdin.isatty():
+            fd = sys.stdin.fileno()
+            saved_tty = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+            loop.add_reader(fd, self._on_stdin_ready)
+
+        try:
+            stats = await self._collect_stats()
+            collected_at = time.monotonic()
+            with Live(self._render(stats), console=self.console, auto_refresh=False, screen=True) as live:
+                try:
+                    while self.running:
+                        try:
+                            key = await asyncio.wait_for(self._keys.get(), timeout=1.0)
+                            self._handle_input(key)
+                        except TimeoutError:
+                            pass
+                        # A key only moves the selection; stats are re-collected once a second
+                        if time.monotonic() - collected_at >= 1.0:
+                            stats = await self._collect_stats()
+                            collected_at = time.monotonic()
+                        live.update(self._render(stats), refresh=True)
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:
+                    # Basic error logging into the feed if we can
+                    self.activity_log.append(f"ERROR: {str(e)}")
+                    await asyncio.sleep(2)
+        finally:
+            # Also stops the Windows key thread
+            self.running = False
+            if saved_tty is not None:
+                loop.remove_reader(sys.stdin.fileno())
+                termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, saved_tty)
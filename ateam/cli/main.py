@@ -4,23 +4,64 @@ A-Team CLI - Main entry point.
 This module provides the command-line interface for A-Team using Typer.
 """
 
+import functools
+import os
+import sys
 import typer
+from operator import attrgetter
 from pathlib import Path
-from rich.console import Console
+from typing import TYPE_CHECKING, Dict
 
 from ateam import __version__
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 app = typer.Typer(
     name="ateam",
     help="Production-grade, security-hardened multi-agent AI orchestration tool",
     add_completion=False,
 )
-console = Console()
+
+# `spawn` templates: file name -> pre-encoded content, with _PROJECT_PLACEHOLDER
+# standing in for the project name
+_PROJECT_PLACEHOLDER = b"{{project}}"
+_SPAWN_TEMPLATES: Dict[str, Dict[str, bytes]] = {
+    "cli-app": {
+        "app.py": (
+            'import typer\nfrom rich.console import Console\n\napp = typer.Typer()\nconsole = Console()\n\n'
+            '@app.command()\ndef hello(name: str = "World"):\n    console.print(f"[bold green]Hello {name}![/bold green] 🚀")\n\n'
+            'if __name__ == "__main__":\n    app()'
+        ).encode(),
+        "pyproject.toml": (
+            b'[project]\nname = "{{project}}"\nversion = "0.1.0"\n'
+            b'dependencies = ["typer", "rich"]\n\n'
+            b'[project.scripts]\n'
+            b'{{project}} = "app:app"'
+        ),
+        "README.md": b"# {{project}}\n\nSpawned by A-Team CLI.",
+    },
+    "python-web": {
+        "main.py": (
+            b'from fastapi import FastAPI\n\napp = FastAPI()\n\n'
+            b'@app.get("/")\ndef read_root():\n    return {"Hello": "World"}\n'
+        ),
+        "requirements.txt": b"fastapi\nuvicorn\n",
+    },
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Shared console, created (and rich imported) on first use."""
+    from rich.console import Console
+    return Console()
 
 
 @app.command()
 def version() -> None:
     """Show A-Team version information."""
+    console = _console()
     console.print(f"[bold cyan]A-Team CLI[/bold cyan] version [green]{__version__}[/green]")
     console.print("Multi-agent AI orchestration for your terminal 🚀")
 
@@ -32,7 +73,8 @@ def init() -> None:
     from rich.prompt import Confirm, Prompt
     from ateam.security import SecureAPIKeyManager
     from ateam.core import ConfigManager
-    import yaml
+    from importlib import resources
+    console = _console()
     
     console.print(Panel(
         "[bold cyan]Welcome to the A-Team Initialization Wizard![/bold cyan]\n"
@@ -51,33 +93,9 @@ def init() -> None:
     # Create directory
     config_dir.mkdir(parents=True, exist_ok=True)
     
-    # Basic Config Template
-    config_data = {
-        "version": "1.0",
-        "default_agent": "Architect",
-        "context_window_size": 30,
-        "auto_prune": True,
-        "show_token_usage": True,
-        "agents": {
-            "Architect": {
-                "provider": "gemini",
-                "model": "gemini-2.5-flash",
-                "api_key_env": "GOOGLE_API_KEY",
-                "system_prompt": "You are a senior software architect. Focus on system design and high-level decisions.",
-                "temperature": 0.7
-            },
-            "Coder": {
-                "provider": "openai",
-                "model": "gpt-4o",
-                "api_key_env": "OPENAI_API_KEY",
-                "system_prompt": "You are an expert engineer. Focus on writing clean, efficient, and well-tested code.",
-                "temperature": 0.3
-            }
-        }
-    }
-    
-    with open(config_path, "w") as f:
-        yaml.dump(config_data, f, default_flow_style=False)
+    # Basic Config Template, shipped pre-serialized
+    config_bytes = resources.files("ateam.cli").joinpath("_default_config.yaml").read_bytes()
+    config_path.write_bytes(config_bytes)
     
     console.print(f"[green]✓[/green] Created configuration at [bold]{config_path}[/bold]")
     
@@ -85,6 +103,8 @@ def init() -> None:
     key_manager = SecureAPIKeyManager()
     
     if Confirm.ask("\nWould you like to store your API keys in the system keyring now?"):
+        from ateam.core.config import load_yaml
+        config_data = load_yaml(config_bytes)
         for agent_name, cfg in config_data["agents"].items():
             env_var = cfg["api_key_env"]
             if Confirm.ask(f"Add key for [bold cyan]{agent_name}[/bold cyan] ({env_var})?"):
@@ -93,8 +113,10 @@ def init() -> None:
                     key_manager.store_key(cfg["provider"], key)
                     console.print(f"[green]✓[/green] Key stored for {cfg['provider']} ({env_var})")
     
-    console.print("\n[bold green]Success![/bold green] A-Team is ready to roll.")
-    console.print("Try joining a room: [cyan]ateam join alpha[/cyan]")
+    console.print(
+        "\n[bold green]Success![/bold green] A-Team is ready to roll.\n"
+        "Try joining a room: [cyan]ateam join alpha[/cyan]"
+    )
 
 
 @app.command()
@@ -111,11 +133,12 @@ def join(
         room_name: Name of the room to join
         description: Optional description for new rooms
     """
-    from ateam.core import RoomManager
+    from ateam.core import get_room_manager
     from rich.panel import Panel
+    console = _console()
     
     try:
-        manager = RoomManager()
+        manager = get_room_manager()
         
         # Check if room exists
         is_new = not manager.room_exists(room_name)
@@ -149,8 +172,11 @@ def join(
         from ateam.cli.chat import ChatInterface
         import asyncio
         
-        chat = ChatInterface(room_name, console=console)
-        asyncio.run(chat.run())
+        async def _chat() -> None:
+            chat = await ChatInterface.create(room_name, console=console)
+            await chat.run()
+
+        asyncio.run(_chat())
             
     except ValueError as e:
         console.print(f"[red]✗ Error:[/red] {e}")
@@ -169,16 +195,21 @@ def join(
 @app.command()
 def rooms() -> None:
     """List all available rooms."""
-    from ateam.core import RoomManager
+    from ateam.core import get_room_manager
+    from rich.console import Group
     from rich.table import Table
+    from rich.text import Text
+    console = _console()
     
     try:
-        manager = RoomManager()
+        manager = get_room_manager()
         room_list = manager.list_rooms()
         
         if not room_list:
-            console.print("[yellow]No rooms found.[/yellow]")
-            console.print("Create a room with: [cyan]ateam join <room-name>[/cyan]")
+            console.print(
+                "[yellow]No rooms found.[/yellow]\n"
+                "Create a room with: [cyan]ateam join <room-name>[/cyan]"
+            )
             return
         
         # Create table
@@ -190,18 +221,15 @@ def rooms() -> None:
         
         # Add rows
         for room in room_list:
-            # Format last active timestamp
-            last_active = room.last_active[:19].replace("T", " ")
-            
             table.add_row(
                 room.name,
                 str(room.message_count),
-                last_active,
+                room.display_last_active,
                 room.description or ""
             )
         
-        console.print(table)
-        console.print(f"\n[dim]Total: {len(room_list)} room(s)[/dim]")
+        # One render and write for the table and its footer
+        console.print(Group(table, Text(f"\nTotal: {len(room_list)} room(s)", style="dim")))
         
     except Exception as e:
         console.print(f"[red]✗ Error:[/red] {e}")
@@ -211,11 +239,12 @@ def rooms() -> None:
 @app.command()
 def status() -> None:
     """Show current session status and last active room."""
-    from ateam.core import RoomManager, ConfigManager
+    from ateam.core import get_config_manager, get_room_manager
     from rich.panel import Panel
+    console = _console()
     
     try:
-        manager = RoomManager()
+        manager = get_room_manager()
         rooms = manager.list_rooms()
         
         if not rooms:
@@ -223,13 +252,13 @@ def status() -> None:
             return
 
         # Find last active room based on metadata
-        last_room = max(rooms, key=lambda r: r.last_active)
-        config = ConfigManager()
+        last_room = max(rooms, key=attrgetter("last_active"))
+        config = get_config_manager()
         
         status_text = f"""
 [bold cyan]Last Active Room:[/bold cyan] {last_room.name}
 [bold cyan]Messages in Room:[/bold cyan] {last_room.message_count}
-[bold cyan]Last Activity:[/bold cyan] {last_room.last_active[:19].replace("T", " ")}
+[bold cyan]Last Activity:[/bold cyan] {last_room.display_last_active}
 [bold cyan]Default Agent:[/bold cyan] [magenta]@{config.config.default_agent}[/magenta]
 [bold cyan]Configuration:[/bold cyan] {config.config_path}
         """
@@ -245,6 +274,7 @@ def web(port: int = typer.Option(8080, "--port", "-p", help="Port to run the web
     """Launch the A-Team Reflection web dashboard."""
     from ateam.web.server import start_server
     import webbrowser
+    console = _console()
     
     # Try to open browser automatically
     webbrowser.open(f"http://localhost:{port}")
@@ -260,6 +290,7 @@ def dash() -> None:
     """Launch the real-time Mission Control dashboard."""
     from ateam.cli.dashboard import Dashboard
     import asyncio
+    console = _console()
     
     dashboard = Dashboard()
     try:
@@ -274,8 +305,7 @@ def spawn(
     name: str = typer.Argument(..., help="Project directory name"),
 ) -> None:
     """Spawn a new project from a team-approved template."""
-    from rich.status import Status
-    import os
+    console = _console()
     
     target = Path(os.getcwd()) / name
     if target.exists():
@@ -285,33 +315,19 @@ def spawn(
     console.print(f"\n[bold cyan]🚀 Spawning Project:[/bold cyan] [white]{name}[/white] ([dim]{template}[/dim])")
     
     try:
-        with console.status(f"[bold yellow]Initializing from {template} template...[/bold yellow]"):
-            target.mkdir(parents=True)
+        # A handful of small writes; a live spinner would cost more than the work
+        console.print(f"[dim]Initializing from {template} template...[/dim]")
+        target.mkdir(parents=True)
+        
+        files = _SPAWN_TEMPLATES.get(template)
+        if files is not None:
+            project = name.encode()
+            for file_name, content in files.items():
+                (target / file_name).write_bytes(content.replace(_PROJECT_PLACEHOLDER, project))
             
-            if template == "cli-app":
-                (target / "app.py").write_text(
-                    'import typer\nfrom rich.console import Console\n\napp = typer.Typer()\nconsole = Console()\n\n'
-                    '@app.command()\ndef hello(name: str = "World"):\n    console.print(f"[bold green]Hello {name}![/bold green] 🚀")\n\n'
-                    'if __name__ == "__main__":\n    app()', encoding="utf-8"
-                )
-                (target / "pyproject.toml").write_text(
-                    f'[project]\nname = "{name}"\nversion = "0.1.0"\n'
-                    'dependencies = ["typer", "rich"]\n\n'
-                    '[project.scripts]\n'
-                    f'{name} = "app:app"', encoding="utf-8"
-                )
-                (target / "README.md").write_text(f"# {name}\n\nSpawned by A-Team CLI.", encoding="utf-8")
-                
-            elif template == "python-web":
-                (target / "main.py").write_text(
-                    'from fastapi import FastAPI\n\napp = FastAPI()\n\n'
-                    '@app.get("/")\ndef read_root():\n    return {"Hello": "World"}\n', encoding="utf-8"
-                )
-                (target / "requirements.txt").write_text("fastapi\nuvicorn\n", encoding="utf-8")
-                
-            else:
-                console.print(f"[yellow]⚠ Template '{template}' is not fully defined in MVP. Creating empty project.[/yellow]")
-                (target / ".keep").touch()
+        else:
+            console.print(f"[yellow]⚠ Template '{template}' is not fully defined in MVP. Creating empty project.[/yellow]")
+            (target / ".keep").touch()
 
         console.print(f"[bold green]✓ Success![/bold green] Project created at [bold]{target.relative_to(os.getcwd())}[/bold]")
         console.print(f"To get started: [cyan]cd {name} && explorer .[/cyan]")
@@ -322,7 +338,23 @@ def spawn(
 
 
 def main() -> None:
-    """Entry point for the CLI."""
+    """
+    Entry point for the CLI.
+
+    ATEAM_FAST_CLI=1 opts into the cyclopts front end (needs the
+    `fast-cli` extra), which skips building Typer's Click command group.
+    Without the extra it falls back to the Typer front end.
+    """
+    if os.environ.get("ATEAM_FAST_CLI") == "1":
+        try:
+            from ateam.cli._fast import run
+        except ImportError:
+            print(
+                'ATEAM_FAST_CLI=1 needs the fast-cli extra (pip install "ateam-cli[fast-cli]"); using the standard CLI.',
+                file=sys.stderr,
+            )
+        else:
+            return run()
     app()
 
 
@@ -1,20 +1,35 @@
 """Core business logic for A-Team CLI."""
 
-from ateam.core.room import RoomManager, RoomMetadata
-from ateam.core.history import HistoryManager, Message
-from ateam.core.context import ContextManager
-from ateam.core.config import ConfigManager, AgentConfig
-from ateam.core.router import AgentRouter
-from ateam.core.indexer import WorkspaceIndexer
+import importlib
 
-__all__ = [
-    "RoomManager", 
-    "RoomMetadata", 
-    "HistoryManager", 
-    "Message", 
-    "ContextManager",
-    "ConfigManager",
-    "AgentConfig",
-    "AgentRouter",
-    "WorkspaceIndexer"
-]
+# Public names -> defining module, imported on first access (PEP 562) so that
+# e.g. `from ateam.core import RoomManager` doesn't load the config and router
+_LAZY = {
+    "RoomManager": "ateam.core.room",
+    "RoomMetadata": "ateam.core.room",
+    "HistoryManager": "ateam.core.history",
+    "Message": "ateam.core.history",
+    "ContextManager": "ateam.core.context",
+    "ConfigManager": "ateam.core.config",
+    "AgentConfig": "ateam.core.config",
+    "AgentRouter": "ateam.core.router",
+    "WorkspaceIndexer": "ateam.core.indexer",
+    "TranscriptWriter": "ateam.core.transcript",
+    "get_config_manager": "ateam.core._singletons",
+    "get_room_manager": "ateam.core._singletons",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
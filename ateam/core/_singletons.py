@@ -0,0 +1,29 @@
+"""
+Process-wide manager instances.
+
+One CLI invocation reuses a single ConfigManager and RoomManager, so the
+config is parsed and the rooms directory set up only once. Tests that
+change HOME or the config between cases should call `.cache_clear()` on
+these accessors.
+"""
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ateam.core.config import ConfigManager
+    from ateam.core.room import RoomManager
+
+
+@functools.lru_cache(maxsize=1)
+def get_config_manager() -> "ConfigManager":
+    """Shared ConfigManager, loaded on first use."""
+    from ateam.core.config import ConfigManager
+    return ConfigManager()
+
+
+@functools.lru_cache(maxsize=1)
+def get_room_manager() -> "RoomManager":
+    """Shared RoomManager for the default rooms directory."""
+    from ateam.core.room import RoomManager
+    return RoomManager()
@@ -5,15 +5,45 @@ This module handles loading and parsing the config.yaml file,
 defining schemas for agents and security settings.
 """
 
+import hashlib
 import os
+import struct
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+import orjson
 import yaml
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, ConfigDict, Field, SecretStr
+
+from ateam.utils.atomic import atomic_write_bytes
+
+# LibYAML's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def load_yaml(stream: Union[bytes, BinaryIO]) -> Any:
+    """
+    Parse YAML with the safe loader, LibYAML's when available.
+
+    Bytes go straight to the parser; LibYAML decodes UTF-8 in C.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+# Dev fallback locations of config.yaml, in search order
+_REPO_ROOT = Path(__file__).parent.parent.parent
+_DEV_CONFIG_DIRS = (Path("."), Path(".context"), _REPO_ROOT / ".context", _REPO_ROOT)
+
+# Header of the parsed-config cache: (st_mtime_ns, st_size) of config.yaml
+_CACHE_HEADER = struct.Struct("<Qq")
 
 
 class AgentConfig(BaseModel):
     """Configuration for an individual agent."""
+    model_config = ConfigDict(frozen=True)
+
     provider: str
     model: str
     api_key_env: Optional[str] = None
@@ -32,6 +62,8 @@ class SecurityConfig(BaseModel):
 
 class GlobalConfig(BaseModel):
     """Root configuration object for A-Team."""
+    model_config = ConfigDict(frozen=True)
+
     version: str
     default_agent: str
     context_window_size: int = 30
@@ -41,6 +73,22 @@ class GlobalConfig(BaseModel):
     security: Dict[str, Any] = Field(default_factory=dict)
 
 
+def _find_dev_config() -> Optional[Path]:
+    """First dev fallback config.yaml, listing each candidate directory once."""
+    listed: Dict[str, set] = {}
+    for parent in _DEV_CONFIG_DIRS:
+        key = os.path.abspath(parent)
+        if key not in listed:
+            try:
+                with os.scandir(parent) as it:
+                    listed[key] = {entry.name for entry in it}
+            except OSError:
+                listed[key] = set()
+        if "config.yaml" in listed[key]:
+            return parent / "config.yaml"
+    return None
+
+
 class ConfigManager:
     """
     Manages loading and accessing A-Team configuration.
@@ -57,46 +105,87 @@ class ConfigManager:
         """
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
         self.config: Optional[GlobalConfig] = None
+        # Lowercased agent name -> config, rebuilt on every load
+        self._agents_ci: Dict[str, AgentConfig] = {}
+        # Bumped on every (re)load so callers can invalidate derived caches
+        self.version = 0
         self.load()
 
     def load(self) -> None:
         """Load configuration from file."""
         if not self.config_path.exists():
             # Dev search path
-            search_paths = [
-                Path("config.yaml"),
-                Path(".context/config.yaml"),
-                Path(__file__).parent.parent.parent / ".context" / "config.yaml",
-                Path(__file__).parent.parent.parent / "config.yaml",
-            ]
-            
-            for path in search_paths:
-                if path.exists():
-                    self.config_path = path
-                    break
-            else:
+            path = _find_dev_config()
+            if path is None:
                 # If still not found, create a minimal default or raise
                 raise FileNotFoundError(f"Config file not found. Checked default and dev fallback paths.")
+            self.config_path = path
+
+        st = self.config_path.stat()
+        config = self._load_cache(st)
+        if config is None:
+            with open(self.config_path, "rb") as f:
+                raw_data = load_yaml(f)
+            config = GlobalConfig.model_validate(raw_data)
+            self._save_cache(st, raw_data)
+        self.config = config
+        self._agents_ci = {name.lower(): cfg for name, cfg in config.agents.items()}
+        self.version += 1
+
+    def _cache_path(self) -> Path:
+        """Cache file under ~/.cache/ateam/config/, keyed by the config's resolved path."""
+        key = hashlib.blake2b(str(self.config_path.resolve()).encode(), digest_size=8).hexdigest()
+        return Path.home() / ".cache" / "ateam" / "config" / f"{key}.json"
+
+    def _load_cache(self, st: os.stat_result) -> Optional[GlobalConfig]:
+        """
+        Load the parsed config cached for this exact config.yaml, if any.
+
+        The cache holds the parsed YAML as JSON, which is re-validated here,
+        so it never outlives a schema change.
 
-        with open(self.config_path, "r") as f:
-            raw_data = yaml.safe_load(f)
-            self.config = GlobalConfig(**raw_data)
+        Returns:
+            The cached GlobalConfig, or None if missing, stale or unreadable
+        """
+        try:
+            data = self._cache_path().read_bytes()
+            if _CACHE_HEADER.unpack_from(data) != (st.st_mtime_ns, st.st_size):
+                return None
+            return GlobalConfig.model_validate(orjson.loads(data[_CACHE_HEADER.size:]))
+        except (OSError, struct.error, ValueError):
+            # orjson.JSONDecodeError and ValidationError are both ValueErrors
+            return None
+
+    def _save_cache(self, st: os.stat_result, raw_data: Any) -> None:
+        """Cache the parsed YAML atomically; skipped if the cache directory isn't writable."""
+        try:
+            payload = orjson.dumps(raw_data)
+        except TypeError:
+            # YAML types JSON can't hold; just parse the YAML next time
+            return
+        cache_path = self._cache_path()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(cache_path, _CACHE_HEADER.pack(st.st_mtime_ns, st.st_size) + payload)
+        except OSError:
+            pass
 
     def get_agent(self, name: str) -> AgentConfig:
         """Get configuration for a specific agent."""
         if not self.config:
             raise RuntimeError("Config not loaded")
         
-        # Exact match
-        if name in self.config.agents:
-            return self.config.agents[name]
-        
-        # Case-insensitive match
-        for agent_name, cfg in self.config.agents.items():
-            if agent_name.lower() == name.lower():
-                return cfg
-                
-        raise ValueError(f"Agent '{name}' not found in configuration.")
+        # Exact match, then case-insensitive
+        cfg = self.config.agents.get(name) or self._agents_ci.get(name.lower())
+        if cfg is None:
+            raise ValueError(f"Agent '{name}' not found in configuration.")
+        return cfg
+
+    def has_agent(self, name: str) -> bool:
+        """Whether get_agent(name) would find an agent, without raising."""
+        if not self.config:
+            return False
+        return name in self.config.agents or name.lower() in self._agents_ci
 
     def get_default_agent(self) -> AgentConfig:
         """Get the default agent configuration."""
@@ -5,7 +5,7 @@ This module handles token-based trimming and sliding windows to ensure
 conversations stay within the context limits of AI models.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from ateam.utils.token_counter import TokenCounter
 
 
@@ -37,21 +37,19 @@ class ContextManager:
 
     def get_trimmed_context(
         self, 
-        messages: List[Dict[str, str]], 
+        messages: Iterable[Dict[str, str]], 
         system_prompt: Optional[str] = None
     ) -> List[Dict[str, str]]:
         """
         Trims a list of messages to fit within the token limit.
         """
-        # Prepare full context
-        full_context = []
+        # Prepare full context; a duplicate system message is dropped when
+        # an explicit system prompt is given
         if system_prompt:
-            full_context.append({"role": "system", "content": system_prompt})
-        
-        for msg in messages:
-            if msg["role"] == "system" and system_prompt:
-                continue
-            full_context.append(msg)
+            full_context = [{"role": "system", "content": system_prompt}]
+            full_context.extend(m for m in messages if m["role"] != "system")
+        else:
+            full_context = list(messages)
 
         if not full_context:
             return []
@@ -59,49 +57,86 @@ class ContextManager:
         # Baseline tokens for any request
         baseline = 3
         
-        # Identify fixed messages (system + first_n)
-        fixed_indices = []
-        if full_context[0]["role"] == "system":
-            fixed_indices.append(0)
-            
-        for i in range(len(fixed_indices), len(fixed_indices) + self.preserve_first_n):
-            if i < len(full_context):
-                fixed_indices.append(i)
-        
-        fixed_msgs = [full_context[i] for i in fixed_indices]
+        # Fixed messages (system + first_n) form a contiguous head
+        n_fixed = 1 if full_context[0]["role"] == "system" else 0
+        n_fixed = min(len(full_context), n_fixed + self.preserve_first_n)
+        fixed_msgs = full_context[:n_fixed]
         
         # Calculate tokens for fixed messages
-        def count_tokens(msgs: List[Dict[str, str]]) -> int:
-            return sum(TokenCounter.estimate_tokens(m["content"]) + 4 for m in msgs)
-
-        fixed_tokens = count_tokens(fixed_msgs)
+        fixed_tokens = sum(self.count_tokens(m["content"]) for m in fixed_msgs)
         
         if baseline + fixed_tokens > self.max_tokens:
             # Over budget even with just fixed messages
-            return fixed_msgs[:1] if fixed_msgs else []
+            return fixed_msgs[:1]
 
         # Available budget for recent messages
         budget = self.max_tokens - baseline - fixed_tokens
         
-        # Select recent messages (backwards from the end)
-        candidates = []
+        # Walk back from the end to find where the recent window starts
+        start = len(full_context)
         current_candidate_tokens = 0
-        
-        # Iterate from the end, skipping fixed messages
-        for i in range(len(full_context) - 1, -1, -1):
-            if i in fixed_indices:
-                continue
-            
-            msg = full_context[i]
-            msg_tokens = TokenCounter.estimate_tokens(msg["content"]) + 4
-            
-            if current_candidate_tokens + msg_tokens <= budget:
-                candidates.insert(0, msg)
-                current_candidate_tokens += msg_tokens
-            else:
+        while start > n_fixed:
+            msg_tokens = self.count_tokens(full_context[start - 1]["content"])
+            if current_candidate_tokens + msg_tokens > budget:
                 break
-                
-        return fixed_msgs + candidates
+            current_candidate_tokens += msg_tokens
+            start -= 1
+
+        return fixed_msgs + full_context[start:]
+
+    def count_tokens(self, content: str) -> int:
+        """
+        Estimate the tokens of a single message, including per-message overhead.
+        """
+        return TokenCounter.estimate_tokens(content) + 4
+
+    def append_and_trim(
+        self,
+        messages: List[Dict[str, str]],
+        tokens: int,
+        new_messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        max_messages: Optional[int] = None
+    ) -> Tuple[List[Dict[str, str]], int]:
+        """
+        Incrementally extend an already trimmed window.
+
+        Only the new messages are tokenized. The oldest messages are then
+        evicted until the window (plus the system prompt) fits within the
+        token limit. ``preserve_first_n`` is not applied here.
+
+        Args:
+            messages: Previously trimmed window, without the system prompt.
+                Extended in place.
+            tokens: Token count of ``messages`` from the previous call.
+            new_messages: Messages to append to the window.
+            system_prompt: Optional system prompt counted against the budget.
+            max_messages: Optional cap on the number of messages kept.
+
+        Returns:
+            Tuple of (window, token count of the window)
+        """
+        for msg in new_messages:
+            messages.append(msg)
+            tokens += self.count_tokens(msg["content"])
+
+        # Baseline + system prompt are always reserved
+        budget = self.max_tokens - 3
+        if system_prompt:
+            budget -= self.count_tokens(system_prompt)
+
+        evict = 0
+        while evict < len(messages) and (
+            tokens > budget
+            or (max_messages is not None and len(messages) - evict > max_messages)
+        ):
+            tokens -= self.count_tokens(messages[evict]["content"])
+            evict += 1
+
+        if evict:
+            del messages[:evict]
+
+        return messages, tokens
 
     def get_token_usage(self, messages: List[Dict[str, str]]) -> Dict[str, int]:
         """
@@ -13,12 +13,58 @@ Features:
 """
 
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional, Dict
+from typing import Any, Iterator, List, Optional, Dict, Tuple
 
 from pydantic import BaseModel, Field
 
+# Per-connection tuning; WAL itself is stored in the database file (see _init_db).
+# NORMAL is durable in WAL mode except for the last commits on power loss.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",  # 20 MB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+)
+
+# Column order expected by _to_messages
+_MESSAGE_COLUMNS = "id, timestamp, role, content, agent_tag, tokens"
+
+# Read queries, built once: each is a single string object, so the connection's
+# statement cache (keyed by SQL text) hands back the prepared statement
+_SQL_HISTORY = f"SELECT {_MESSAGE_COLUMNS} FROM messages ORDER BY id ASC LIMIT ? OFFSET ?"
+_SQL_LAST = (
+    f"SELECT {_MESSAGE_COLUMNS} FROM "
+    f"(SELECT {_MESSAGE_COLUMNS} FROM messages ORDER BY id DESC LIMIT ?) ORDER BY id ASC"
+)
+_SQL_SEARCH_FTS = (
+    f"SELECT {_MESSAGE_COLUMNS} FROM messages WHERE id IN "
+    "(SELECT rowid FROM messages_fts WHERE messages_fts MATCH ?) ORDER BY id DESC"
+)
+_SQL_SEARCH_LIKE = f"SELECT {_MESSAGE_COLUMNS} FROM messages WHERE content LIKE ? ORDER BY id DESC"
+_SQL_DISPLAY_ROWS = {
+    order: "SELECT role, content, agent_tag FROM "
+    f"(SELECT id, role, content, agent_tag FROM messages ORDER BY id DESC LIMIT ?) ORDER BY id {order}"
+    for order in ("ASC", "DESC")
+}
+
+# Trigram full-text index over message content, kept in sync by triggers
+# (external content table, see https://sqlite.org/fts5.html#external_content_tables).
+# Trigrams keep search_messages' case-insensitive substring semantics.
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5("
+    "content, content='messages', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN "
+    "INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN "
+    "INSERT INTO messages_fts(messages_fts, rowid, content) VALUES ('delete', old.id, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE ON messages BEGIN "
+    "INSERT INTO messages_fts(messages_fts, rowid, content) VALUES ('delete', old.id, old.content); "
+    "INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content); END",
+)
+
 
 class Message(BaseModel):
     """Represents a single message in the conversation history."""
@@ -38,6 +84,26 @@ class Message(BaseModel):
         }
 
 
+def _to_messages(rows: List[tuple]) -> List[Message]:
+    """
+    Build Messages from plain ``_MESSAGE_COLUMNS`` tuples.
+
+    Regular construction is kept on purpose: with pydantic-core, validating
+    these few fields is faster than model_construct's Python-level copy.
+    """
+    return [
+        Message(
+            id=msg_id,
+            timestamp=datetime.fromisoformat(timestamp),
+            role=role,
+            content=content,
+            agent_tag=agent_tag,
+            tokens=tokens
+        )
+        for msg_id, timestamp, role, content, agent_tag, tokens in rows
+    ]
+
+
 class HistoryManager:
     """
     Manages persistent conversation history using SQLite.
@@ -54,32 +120,69 @@ class HistoryManager:
             db_path: Path to the SQLite database file for the room.
         """
         self.db_path = db_path
+        # One connection per thread, kept open for the manager's lifetime
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a connection to the SQLite database."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's connection to the SQLite database, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Only ever used by this thread; close() may run on another one
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
         return conn
 
+    def close(self) -> None:
+        """Close the connections of all threads."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
     def _init_db(self) -> None:
         """Initialize the database schema if it doesn't exist."""
         conn = self._get_connection()
+        # Write-ahead logging: one fsync per checkpoint rather than per
+        # commit, and readers don't block the writer. Not available in memory.
+        if str(self.db_path) != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS messages (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    agent_tag TEXT,
+                    tokens INTEGER DEFAULT 0
+                )
+            """)
+            # Reads order by the autoincrement id (insertion order), which the
+            # primary key already provides; a timestamp index only slowed inserts
+            conn.execute("DROP INDEX IF EXISTS idx_timestamp")
+
+        # Full-text index, when SQLite was built with FTS5 (3.34+ for trigrams)
         try:
             with conn:
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS messages (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        timestamp TEXT NOT NULL,
-                        role TEXT NOT NULL,
-                        content TEXT NOT NULL,
-                        agent_tag TEXT,
-                        tokens INTEGER DEFAULT 0
-                    )
-                """)
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON messages(timestamp)")
-        finally:
-            conn.close()
+                is_new = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'messages_fts'"
+                ).fetchone() is None
+                for statement in _FTS_SCHEMA:
+                    conn.execute(statement)
+                if is_new:
+                    # Index messages written before the table existed
+                    conn.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
+            self._fts = True
+        except sqlite3.OperationalError:
+            self._fts = False
 
     def add_message(
         self, 
@@ -100,61 +203,80 @@ class HistoryManager:
         Returns:
             The created Message object
         """
-        timestamp = datetime.utcnow().isoformat()
+        now = datetime.utcnow()
+        timestamp = now.isoformat()
         
         conn = self._get_connection()
-        try:
-            with conn:
-                cursor = conn.execute(
-                    "INSERT INTO messages (timestamp, role, content, agent_tag, tokens) VALUES (?, ?, ?, ?, ?)",
-                    (timestamp, role, content, agent_tag, tokens)
-                )
-                msg_id = cursor.lastrowid
-        finally:
-            conn.close()
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO messages (timestamp, role, content, agent_tag, tokens) VALUES (?, ?, ?, ?, ?)",
+                (timestamp, role, content, agent_tag, tokens)
+            )
+            msg_id = cursor.lastrowid
             
         return Message(
             id=msg_id,
-            timestamp=datetime.fromisoformat(timestamp),
+            timestamp=now,
             role=role,
             content=content,
             agent_tag=agent_tag,
             tokens=tokens
         )
 
-    def get_history(self, limit: int = 50, offset: int = 0) -> List[Message]:
+    def add_messages(self, messages: List[Tuple[str, str, Optional[str]]]) -> List[Message]:
         """
-        Retrieve messages from the history.
+        Add several messages in a single transaction.
 
         Args:
-            limit: Maximum number of messages to return
-            offset: Number of messages to skip
+            messages: List of (role, content, agent_tag) tuples
 
         Returns:
-            List of Message objects, ordered by timestamp ascending
+            The created Message objects, in insertion order
         """
+        if not messages:
+            return []
+        now = datetime.utcnow()
+        timestamp = now.isoformat()
+
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM messages ORDER BY timestamp ASC LIMIT ? OFFSET ?",
-                (limit, offset)
+        with conn:
+            conn.executemany(
+                "INSERT INTO messages (timestamp, role, content, agent_tag, tokens) VALUES (?, ?, ?, ?, ?)",
+                [(timestamp, role, content, agent_tag, 0) for role, content, agent_tag in messages]
             )
-            rows = cursor.fetchall()
-        finally:
-            conn.close()
-            
+            # The transaction holds the write lock, so the new IDs are consecutive
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        ids = range(last_id - len(messages) + 1, last_id + 1)
+
         return [
             Message(
-                id=row["id"],
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-                role=row["role"],
-                content=row["content"],
-                agent_tag=row["agent_tag"],
-                tokens=row["tokens"]
+                id=msg_id,
+                timestamp=now,
+                role=role,
+                content=content,
+                agent_tag=agent_tag,
+                tokens=0
             )
-            for row in rows
+            for msg_id, (role, content, agent_tag) in zip(ids, messages, strict=True)
         ]
 
+    def get_history(self, limit: int = 50, offset: int = 0) -> List[Message]:
+        """
+        Retrieve messages from the history.
+
+        Args:
+            limit: Maximum number of messages to return
+            offset: Number of messages to skip
+
+        Returns:
+            List of Message objects, oldest first
+        """
+        conn = self._get_connection()
+        cursor = conn.execute(_SQL_HISTORY, (limit, offset))
+        rows = cursor.fetchall()
+            
+        return _to_messages(rows)
+
     def get_last_messages(self, limit: int = 5) -> List[Message]:
         """
         Retrieve the most recent messages.
@@ -163,88 +285,107 @@ class HistoryManager:
             limit: Number of recent messages to return
 
         Returns:
-            List of Message objects, ordered by timestamp ascending
+            List of Message objects, oldest first
         """
         conn = self._get_connection()
-        try:
-            # We sub-select to get them in ascending order for context windows
-            cursor = conn.execute(
-                "SELECT * FROM (SELECT * FROM messages ORDER BY id DESC LIMIT ?) ORDER BY id ASC",
-                (limit,)
-            )
-            rows = cursor.fetchall()
-        finally:
-            conn.close()
+        # We sub-select to get them in ascending order for context windows
+        cursor = conn.execute(_SQL_LAST, (limit,))
+        rows = cursor.fetchall()
             
+        return _to_messages(rows)
+
+    def get_context_dicts(self, limit: int = 50, after_id: int = 0) -> Tuple[List[Dict[str, str]], int]:
+        """
+        Retrieve recent messages as provider-ready role/content dicts.
+
+        Ordering happens in SQL and no intermediate Message objects are built.
+        Roles map to shared 'assistant'/'user' constants ('system' is sent as
+        'user'), so rows don't each allocate a role string.
+
+        Args:
+            limit: Maximum number of messages to return
+            after_id: Only messages with an ID greater than this are returned
+
+        Returns:
+            Tuple of (dicts ordered oldest first, ID of the newest returned
+            message or ``after_id`` if none)
+        """
+        conn = self._get_connection()
+        cursor = conn.execute(
+            "SELECT id, role = 'assistant', content "
+            "FROM (SELECT id, role, content FROM messages WHERE id > ? ORDER BY id DESC LIMIT ?) "
+            "ORDER BY id ASC",
+            (after_id, limit)
+        )
+        rows = cursor.fetchall()
+
+        if not rows:
+            return [], after_id
         return [
-            Message(
-                id=row["id"],
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-                role=row["role"],
-                content=row["content"],
-                agent_tag=row["agent_tag"],
-                tokens=row["tokens"]
-            )
-            for row in rows
-        ]
+            {"role": "assistant" if is_assistant else "user", "content": content}
+            for _, is_assistant, content in rows
+        ], rows[-1][0]
+
+    def iter_display_rows(
+        self, limit: int = 50, newest_first: bool = False
+    ) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """
+        Iterate over the most recent messages for display only.
+
+        Rows are plain ``(role, content, agent_tag)`` tuples; no Message
+        objects or timestamp parsing.
+
+        Args:
+            limit: Number of recent messages to return
+            newest_first: Yield the newest message first instead of last
+
+        Yields:
+            Tuples of (role, content, agent_tag)
+        """
+        conn = self._get_connection()
+        rows = conn.execute(_SQL_DISPLAY_ROWS["DESC" if newest_first else "ASC"], (limit,)).fetchall()
+
+        yield from rows
 
     def clear_history(self) -> None:
         """Delete all messages from the history."""
         conn = self._get_connection()
-        try:
-            with conn:
-                conn.execute("DELETE FROM messages")
-        finally:
-            conn.close()
+        with conn:
+            conn.execute("DELETE FROM messages")
 
     def get_message_count(self) -> int:
         """Get the total number of messages in the room."""
         conn = self._get_connection()
-        try:
-            cursor = conn.execute("SELECT COUNT(*) FROM messages")
-            count = cursor.fetchone()[0]
-        finally:
-            conn.close()
+        cursor = conn.execute("SELECT COUNT(*) FROM messages")
+        count = cursor.fetchone()[0]
         return count
 
     def get_token_usage(self) -> int:
         """Get the total token usage in the room."""
         conn = self._get_connection()
-        try:
-            cursor = conn.execute("SELECT SUM(tokens) FROM messages")
-            row = cursor.fetchone()
-            return row[0] if row and row[0] else 0
-        finally:
-            conn.close()
+        cursor = conn.execute("SELECT SUM(tokens) FROM messages")
+        row = cursor.fetchone()
+        return row[0] if row and row[0] else 0
 
     def search_messages(self, query: str) -> List[Message]:
         """
-        Search for messages containing the query string.
+        Search for messages containing the query string (case-insensitive).
+
+        Uses the trigram index when available; queries shorter than a
+        trigram fall back to scanning with LIKE.
 
         Args:
             query: Text to search for
 
         Returns:
-            List of matching Message objects
+            List of matching Message objects, newest first
         """
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM messages WHERE content LIKE ? ORDER BY timestamp DESC",
-                (f"%{query}%",)
-            )
-            rows = cursor.fetchall()
-        finally:
-            conn.close()
+        if self._fts and len(query) >= 3:
+            # A quoted FTS5 string matches the text literally
+            cursor = conn.execute(_SQL_SEARCH_FTS, ('"' + query.replace('"', '""') + '"',))
+        else:
+            cursor = conn.execute(_SQL_SEARCH_LIKE, (f"%{query}%",))
+        rows = cursor.fetchall()
             
-        return [
-            Message(
-                id=row["id"],
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-                role=row["role"],
-                content=row["content"],
-                agent_tag=row["agent_tag"],
-                tokens=row["tokens"]
-            )
-            for row in rows
-        ]
+        return _to_messages(rows)
@@ -3,9 +3,56 @@ Lightweight Workspace Indexing for A-Team CLI.
 """
 
 import os
+import re
 import ast
+import bisect
+import hashlib
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+
+import orjson
+
+from ateam.utils.atomic import atomic_write_bytes
+
+IGNORED_DIRS = {".git", "__pycache__", ".venv", ".pytest_cache", "node_modules", ".context"}
+INDEXED_SUFFIXES = (".py", ".md", ".txt")
+# Larger files (vendored bundles, data dumps) are listed with no items, unread
+MAX_INDEXED_FILE_SIZE = 1_000_000
+
+# Word tokens of paths and signatures, for the find_relevant_files index
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def _parse_python(path: Path) -> List[str]:
+    """
+    Extracts function and class signatures from a Python file.
+
+    Only the module body and class bodies are visited, not nested scopes.
+    """
+    try:
+        tree = ast.parse(path.read_bytes().decode("utf-8", "replace"), type_comments=False)
+    except Exception:
+        # OSError, SyntaxError, ValueError (null bytes), RecursionError
+        return []
+
+    signatures: List[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            signatures.append(f"Function: {node.name}")
+        elif isinstance(node, ast.ClassDef):
+            methods = [n.name for n in node.body if isinstance(n, ast.FunctionDef)]
+            signatures.append(f"Class: {node.name} (Methods: {', '.join(methods)})")
+    return signatures
+
+
+def _with_prefix(sorted_tokens: List[str], prefix: str) -> List[str]:
+    """Tokens of a sorted list that start with `prefix`."""
+    i = bisect.bisect_left(sorted_tokens, prefix)
+    matches = []
+    while i < len(sorted_tokens) and sorted_tokens[i].startswith(prefix):
+        matches.append(sorted_tokens[i])
+        i += 1
+    return matches
 
 
 class WorkspaceIndexer:
@@ -13,74 +60,203 @@ class WorkspaceIndexer:
     Scans the workspace to build a map of available code context.
     """
 
-    def __init__(self, root_dir: str = "."):
+    def __init__(self, root_dir: str = ".", cache_path: Optional[Path] = None):
         self.root_dir = Path(root_dir)
+        self.cache_path = cache_path # persisted scan results, if set
         self.index: Dict[str, List[str]] = {} # path -> list of snippets/signatures
+        self.version = 0 # bumped whenever the index changes
+        # path -> (mtime_ns, size, items) of every indexed file, including ones without items
+        self._files: Dict[str, Tuple[int, int, List[str]]] = {}
+        # token -> paths whose path or items contain it; rebuilt lazily per index version
+        self._postings: Tuple[Dict[str, Set[str]], List[str], List[str]] = ({}, [], [])
+        self._postings_version = -1
+
+    @staticmethod
+    def default_cache_path(root_dir: str = ".") -> Path:
+        """Per-workspace cache file under ~/.cache/ateam/index/."""
+        key = hashlib.blake2b(str(Path(root_dir).resolve()).encode(), digest_size=8).hexdigest()
+        return Path.home() / ".cache" / "ateam" / "index" / f"{key}.json"
+
+    def load_cached(self) -> bool:
+        """
+        Load the persisted scan results, if any, without touching the workspace.
+
+        Returns:
+            True if a cache for this workspace was loaded
+        """
+        if self.cache_path is None:
+            return False
+        try:
+            data = orjson.loads(self.cache_path.read_bytes())
+            if data.get("root") != str(self.root_dir.resolve()):
+                return False
+            files = {rel: (mtime, size, items) for rel, (mtime, size, items) in data["files"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        self._files = files
+        self.index = {rel: items for rel, (_, _, items) in files.items() if items}
+        self.version += 1
+        return True
+
+    def save_cached(self) -> None:
+        """Persist the scan results atomically."""
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(
+            self.cache_path, orjson.dumps({"root": str(self.root_dir.resolve()), "files": self._files})
+        )
 
     def refresh(self):
-        """Re-scans the workspace."""
-        self.index = {}
-        ignored_dirs = {".git", "__pycache__", ".venv", ".pytest_cache", "node_modules", ".context"}
-        
-        for path in self.root_dir.rglob("*"):
-            if any(ignored in path.parts for ignored in ignored_dirs):
-                continue
-            
-            if not path.is_file():
+        """
+        Re-scans the workspace.
+
+        Ignored directories are pruned while walking, and files whose mtime and
+        size are unchanged since the last scan reuse their previous entries.
+        """
+        files: Dict[str, Tuple[int, int, List[str]]] = {}
+        stack = [self.root_dir]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
                 continue
 
-            if path.suffix == ".py":
-                self._index_python(path)
-            elif path.suffix in (".md", ".txt"):
-                self._index_text(path)
+            subdirs = []
+            for entry in entries:
+                if entry.name in IGNORED_DIRS:
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    if not entry.name.endswith(INDEXED_SUFFIXES) or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+
+                path = Path(entry.path)
+                rel = str(path.relative_to(self.root_dir))
+                cached = self._files.get(rel)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    files[rel] = cached
+                    continue
+
+                if st.st_size > MAX_INDEXED_FILE_SIZE:
+                    files[rel] = (st.st_mtime_ns, st.st_size, [])
+                elif path.suffix == ".py":
+                    files[rel] = (st.st_mtime_ns, st.st_size, self._index_python(path))
+                else:
+                    files[rel] = (st.st_mtime_ns, st.st_size, self._index_text(path))
 
-    def _index_python(self, path: Path):
+            # Depth-first, in directory order
+            stack.extend(reversed(subdirs))
+
+        index = {rel: items for rel, (_, _, items) in files.items() if items}
+        changed = files != self._files
+        self._files = files
+        if index != self.index:
+            self.index = index
+            self.version += 1
+        if changed:
+            self.save_cached()
+
+    def _index_python(self, path: Path) -> List[str]:
         """Extracts function and class signatures from Python files."""
-        try:
-            content = path.read_text(encoding="utf-8")
-            tree = ast.parse(content)
-            signatures = []
-            
-            for node in tree.body:
-                if isinstance(node, ast.FunctionDef):
-                    signatures.append(f"Function: {node.name}")
-                elif isinstance(node, ast.ClassDef):
-                    methods = [n.name for n in node.body if isinstance(n, ast.FunctionDef)]
-                    signatures.append(f"Class: {node.name} (Methods: {', '.join(methods)})")
-            
-            if signatures:
-                self.index[str(path.relative_to(self.root_dir))] = signatures
-        except Exception:
-            pass
+        return _parse_python(path)
 
-    def _index_text(self, path: Path):
+    def _index_text(self, path: Path) -> List[str]:
         """Extracts headers or short summaries from text files."""
         try:
-            content = path.read_text(encoding="utf-8")
+            content = path.read_bytes().decode("utf-8", "replace")
             lines = content.splitlines()
-            headers = [line for line in lines if line.strip().startswith("#")][:5]
-            if headers:
-                self.index[str(path.relative_to(self.root_dir))] = headers
+            return [line for line in lines if line.strip().startswith("#")][:5]
         except Exception:
-            pass
+            return []
 
     def get_summary(self) -> str:
         """Returns a string representation of the workspace overview."""
         if not self.index:
             return "No workspace context indexed."
         
-        summary = "Workspace Context Map:\n"
+        parts = ["Workspace Context Map:\n"]
         for path, items in self.index.items():
-            summary += f"- {path}:\n"
-            for item in items:
-                summary += f"  * {item}\n"
-        return summary
+            parts.append(f"- {path}:\n")
+            parts.extend(f"  * {item}\n" for item in items)
+        return "".join(parts)
+
+    def _get_postings(self) -> Tuple[Dict[str, Set[str]], List[str], List[str]]:
+        """
+        Inverted index of the current index: token -> paths, plus the tokens
+        sorted as-is and reversed, for prefix and suffix lookups.
+        """
+        if self._postings_version != self.version:
+            postings: Dict[str, Set[str]] = {}
+            for path, items in self.index.items():
+                for text in (path, *items):
+                    for token in _TOKEN_RE.findall(text.lower()):
+                        postings.setdefault(token, set()).add(path)
+            self._postings = (postings, sorted(postings), sorted(token[::-1] for token in postings))
+            self._postings_version = self.version
+        return self._postings
+
+    def _paths_for_word(self, word: str, at_start: bool, at_end: bool) -> Optional[Set[str]]:
+        """
+        Paths with a token that can hold `word`, a word of the query.
+
+        A word inside the query must be a whole token; one at the start of
+        the query may end a token, one at the end may start a token, and a
+        query that is a single word may appear anywhere in a token.
+
+        Returns:
+            The paths, or None if the word is too short to narrow anything down
+        """
+        postings, tokens, reversed_tokens = self._get_postings()
+        if not at_start and not at_end:
+            return postings.get(word, set())
+        if at_start and at_end:
+            if len(word) < 3:
+                # Found in nearly every token; scanning them costs more than it saves
+                return None
+            matches = [token for token in tokens if word in token]
+        elif at_end:
+            matches = _with_prefix(tokens, word)
+        else:
+            matches = [token[::-1] for token in _with_prefix(reversed_tokens, word[::-1])]
+        paths: Set[str] = set()
+        for token in matches:
+            paths |= postings[token]
+        return paths
 
     def find_relevant_files(self, query: str) -> List[str]:
-        """Simple keyword search for relevant files."""
+        """
+        Simple keyword search for relevant files.
+
+        A file matches if the query is a case-insensitive substring of its
+        path or one of its items. The token index narrows the candidates
+        (every word of the query must fit a token of the file) before the
+        full query is checked.
+        """
         query = query.lower()
+        words = [(m.group(), m.start() == 0, m.end() == len(query)) for m in _TOKEN_RE.finditer(query)]
+        # Exact token lookups first, then prefix/suffix, then substring scans
+        words.sort(key=lambda w: w[1] + w[2])
+        candidates: Optional[Set[str]] = None
+        for word, at_start, at_end in words:
+            paths = self._paths_for_word(word, at_start, at_end)
+            if paths is None:
+                continue
+            candidates = paths if candidates is None else candidates & paths
+            if not candidates:
+                return []
+
         relevant = []
         for path, items in self.index.items():
+            if candidates is not None and path not in candidates:
+                continue
             if query in path.lower() or any(query in item.lower() for item in items):
                 relevant.append(path)
         return relevant
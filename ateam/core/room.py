@@ -12,15 +12,26 @@ Features:
 - Room validation and security
 """
 
-import json
+import functools
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
+import orjson
 from pydantic import BaseModel, Field
 
 from ateam.security.validation import InputValidator
+from ateam.utils.atomic import atomic_write_bytes
+
+if TYPE_CHECKING:
+    from ateam.core.history import HistoryManager
+    from ateam.core.transcript import TranscriptWriter
+
+
+def _utc_epoch(dt: datetime) -> float:
+    """Unix timestamp of a naive UTC datetime."""
+    return dt.replace(tzinfo=timezone.utc).timestamp()
 
 
 class RoomMetadata(BaseModel):
@@ -31,10 +42,24 @@ class RoomMetadata(BaseModel):
     last_active: str = Field(..., description="ISO timestamp of last activity")
     message_count: int = Field(default=0, description="Total messages in room")
     description: Optional[str] = Field(None, description="Optional room description")
+    last_active_epoch: float = Field(default=0.0, description="Last activity as a Unix timestamp")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Derive the epoch from last_active when it wasn't stored (older metadata files)."""
+        if not self.last_active_epoch:
+            self.last_active_epoch = _utc_epoch(datetime.fromisoformat(self.last_active))
+
+    @functools.cached_property
+    def display_last_active(self) -> str:
+        """last_active as "YYYY-MM-DD HH:MM:SS" for tables and panels."""
+        return self.last_active[:19].replace("T", " ")
 
     def update_last_active(self) -> None:
         """Update the last active timestamp to now."""
-        self.last_active = datetime.utcnow().isoformat()
+        now = datetime.utcnow()
+        self.last_active = now.isoformat()
+        self.last_active_epoch = _utc_epoch(now)
+        self.__dict__.pop("display_last_active", None)
 
     def increment_message_count(self) -> None:
         """Increment the message count."""
@@ -60,6 +85,9 @@ class RoomManager:
         "my-project"
     """
 
+    # Rejoining within this many seconds of the stored last_active skips the metadata rewrite
+    LAST_ACTIVE_WRITE_INTERVAL = 5.0
+
     def __init__(self, base_dir: Optional[Path] = None) -> None:
         """
         Initialize the room manager.
@@ -84,6 +112,9 @@ class RoomManager:
         # Currently active room
         self.current_room: Optional[str] = None
 
+        # Room name -> ((mtime_ns, size) of metadata.json, parsed metadata), for list_rooms
+        self._meta_cache: Dict[str, Tuple[Tuple[int, int], RoomMetadata]] = {}
+
     def _get_room_dir(self, room_name: str) -> Path:
         """
         Get the directory path for a room.
@@ -126,8 +157,7 @@ class RoomManager:
         if not metadata_path.exists():
             raise FileNotFoundError(f"Room '{room_name}' does not exist")
 
-        with open(metadata_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(metadata_path.read_bytes())
 
         return RoomMetadata(**data)
 
@@ -141,8 +171,11 @@ class RoomManager:
         """
         metadata_path = self._get_metadata_path(room_name)
 
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata.model_dump(), f, indent=2)
+        # Unique temp file then rename, so readers never see a half-written
+        # file and concurrent sessions never share a temp path
+        atomic_write_bytes(metadata_path, orjson.dumps(metadata.model_dump(), option=orjson.OPT_INDENT_2))
+        # Don't trust the mtime to reveal a rewrite within the same clock tick
+        self._meta_cache.pop(room_name, None)
 
     def room_exists(self, room_name: str) -> bool:
         """
@@ -221,9 +254,11 @@ class RoomManager:
             metadata = self.create_room(room_name)
         else:
             metadata = self._load_metadata(room_name)
+            stored_epoch = metadata.last_active_epoch
             # Update last active time
             metadata.update_last_active()
-            self._save_metadata(room_name, metadata)
+            if metadata.last_active_epoch - stored_epoch >= self.LAST_ACTIVE_WRITE_INTERVAL:
+                self._save_metadata(room_name, metadata)
 
         # Set as current room
         self.current_room = room_name
@@ -247,27 +282,43 @@ class RoomManager:
         """
         List all available rooms.
 
+        Metadata files are only re-read when their mtime or size changed
+        since the previous call.
+
         Returns:
             List of RoomMetadata objects, sorted by last active (newest first)
         """
         rooms = []
+        cache: Dict[str, Tuple[Tuple[int, int], RoomMetadata]] = {}
 
         # Iterate through room directories
-        if not self.base_dir.exists():
+        try:
+            entries = list(os.scandir(self.base_dir))
+        except FileNotFoundError:
             return rooms
 
-        for room_dir in self.base_dir.iterdir():
-            if room_dir.is_dir():
-                metadata_path = room_dir / "metadata.json"
-                if metadata_path.exists():
-                    try:
-                        with open(metadata_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                        metadata = RoomMetadata(**data)
-                        rooms.append(metadata)
-                    except (json.JSONDecodeError, ValueError):
-                        # Skip corrupted metadata files
-                        continue
+        for entry in entries:
+            metadata_path = os.path.join(entry.path, "metadata.json")
+            try:
+                st = os.stat(metadata_path)
+            except OSError:
+                # Not a room directory
+                continue
+
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = self._meta_cache.get(entry.name)
+            if cached is None or cached[0] != signature:
+                try:
+                    data = orjson.loads(Path(metadata_path).read_bytes())
+                    cached = (signature, RoomMetadata(**data))
+                except (OSError, ValueError): # ValueError includes orjson.JSONDecodeError
+                    # Skip corrupted metadata files
+                    continue
+            cache[entry.name] = cached
+            # Callers may mutate what they get; the cached copy stays pristine
+            rooms.append(cached[1].model_copy())
+
+        self._meta_cache = cache
 
         # Sort by last active (newest first)
         rooms.sort(key=lambda r: r.last_active, reverse=True)
@@ -317,7 +368,10 @@ class RoomManager:
         return self._load_metadata(room_name)
 
     def update_room_metadata(
-        self, room_name: str, description: Optional[str] = None
+        self,
+        room_name: str,
+        description: Optional[str] = None,
+        message_count: Optional[int] = None,
     ) -> RoomMetadata:
         """
         Update metadata for a room.
@@ -325,6 +379,7 @@ class RoomManager:
         Args:
             room_name: Name of the room
             description: New description (optional)
+            message_count: New message count (optional)
 
         Returns:
             Updated RoomMetadata
@@ -336,12 +391,36 @@ class RoomManager:
 
         if description is not None:
             metadata.description = description
+        if message_count is not None:
+            metadata.message_count = message_count
 
         metadata.update_last_active()
         self._save_metadata(room_name, metadata)
 
         return metadata
 
+    def add_message_count(self, room_name: str, count: int) -> RoomMetadata:
+        """
+        Add to a room's stored message count.
+
+        The metadata is re-read first, so counts added by other sessions in
+        the same room and unrelated changes (e.g. the description) are kept.
+
+        Args:
+            room_name: Name of the room
+            count: Number of messages to add
+
+        Returns:
+            Updated RoomMetadata
+
+        Raises:
+            FileNotFoundError: If room doesn't exist
+        """
+        metadata = self._load_metadata(room_name)
+        metadata.message_count += count
+        self._save_metadata(room_name, metadata)
+        return metadata
+
     def get_history(self, room_name: str) -> "HistoryManager":
         """
         Get the HistoryManager for a specific room.
@@ -363,6 +442,26 @@ class RoomManager:
         db_path = self._get_room_dir(room_name) / "history.db"
         return HistoryManager(db_path)
 
+    def get_transcript(self, room_name: str) -> "TranscriptWriter":
+        """
+        Get the TranscriptWriter for a specific room.
+
+        Args:
+            room_name: Name of the room
+
+        Returns:
+            TranscriptWriter appending to the room's transcript.jsonl
+
+        Raises:
+            FileNotFoundError: If room doesn't exist
+        """
+        from ateam.core.transcript import TranscriptWriter
+
+        if not self.room_exists(room_name):
+            raise FileNotFoundError(f"Room '{room_name}' does not exist")
+
+        return TranscriptWriter(self._get_room_dir(room_name) / "transcript.jsonl")
+
     def get_room_path(self, room_name: str) -> Path:
         """
         Get the filesystem path for a room.
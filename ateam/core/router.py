@@ -5,8 +5,9 @@ This module handles parsing @mentions in user messages and routing
 requests to the appropriate AI agent/provider.
 """
 
+import hashlib
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from ateam.core.config import ConfigManager, AgentConfig
 from ateam.providers import ProviderFactory, BaseProvider, ProviderConfig, CompletionResponse
 
@@ -17,8 +18,10 @@ class AgentRouter:
     """
 
     # Matches @AgentName at the start or middle of a message
-    # Allows alphanumeric characters and underscores
-    AGENT_TAG_PATTERN = re.compile(r"@([a-zA-Z0-9_]+)")
+    # Allows alphanumeric characters and underscores; an @ right after one of
+    # those (user@example.com) is not a mention. The lookbehind comes after
+    # the literal @ so the engine can still skip ahead to each @.
+    AGENT_TAG_PATTERN = re.compile(r"@(?<!\w@)(\w+)", re.ASCII)
 
     def __init__(self, config_manager: ConfigManager) -> None:
         """
@@ -28,7 +31,10 @@ class AgentRouter:
             config_manager: The loaded configuration manager.
         """
         self.config = config_manager
-        self._provider_cache: Dict[str, BaseProvider] = {}
+        # (config version, provider settings..., API key digest) -> provider
+        self._provider_cache: Dict[Tuple[Any, ...], BaseProvider] = {}
+        # Agent name -> its key in _provider_cache
+        self._agent_keys: Dict[str, Tuple[Any, ...]] = {}
 
     def parse_mentions(self, text: str) -> List[str]:
         """
@@ -39,6 +45,25 @@ class AgentRouter:
         """
         return self.AGENT_TAG_PATTERN.findall(text)
 
+    def _is_agent(self, name: str) -> bool:
+        """Whether a mention names a configured agent."""
+        return self.config.has_agent(name)
+
+    def select_agent(self, text: str) -> Tuple[str, str]:
+        """
+        Determine the single agent that should respond.
+
+        The first mention of a configured agent wins and only that mention is
+        removed; other text (including further mentions) is kept.
+
+        Returns:
+            Tuple of (agent name, cleaned text)
+        """
+        for match in self.AGENT_TAG_PATTERN.finditer(text):
+            if self._is_agent(match.group(1)):
+                return match.group(1), (text[:match.start()] + text[match.end():]).strip()
+        return self.config.config.default_agent, text
+
     def select_agents(self, text: str) -> Tuple[List[str], str]:
         """
         Determine which agent(s) should respond and return the cleaned text.
@@ -46,30 +71,23 @@ class AgentRouter:
         Returns:
             Tuple of (list of agent names, cleaned text)
         """
-        mentions = self.parse_mentions(text)
-        
         valid_agents = []
-        cleaned = text
 
-        for mention in mentions:
-            try:
-                self.config.get_agent(mention)
-                valid_agents.append(mention)
-                cleaned = cleaned.replace(f"@{mention}", "")
-            except ValueError:
-                continue
-                
-        cleaned = cleaned.strip()
+        def strip_agent(match: "re.Match[str]") -> str:
+            # Mentions of configured agents are removed in the same pass that finds them
+            if self._is_agent(match.group(1)):
+                valid_agents.append(match.group(1))
+                return ""
+            return match.group(0)
+
+        cleaned = self.AGENT_TAG_PATTERN.sub(strip_agent, text).strip()
 
         if not valid_agents:
             # Fallback to default agent if no valid mentions found
             return [self.config.config.default_agent], cleaned
         
         # Remove duplicates while preserving order
-        seen = set()
-        unique_agents = [x for x in valid_agents if not (x in seen or seen.add(x))]
-
-        return unique_agents, cleaned
+        return list(dict.fromkeys(valid_agents)), cleaned
 
     def detect_handoff(self, response_text: str, current_agent: str) -> Optional[str]:
         """
@@ -89,37 +107,52 @@ class AgentRouter:
                 continue
             
             # Check if it's a valid agent
-            try:
-                self.config.get_agent(mention)
+            if self._is_agent(mention):
                 return mention
-            except ValueError:
-                continue
         return None
 
     def get_provider_for_agent(self, agent_name: str, api_key: str) -> BaseProvider:
         """
         Instantiate or get a cached provider for a specific agent.
-        """
-        # We cache by agent_name to preserve the specific ProviderConfig
-        if agent_name in self._provider_cache:
-            return self._provider_cache[agent_name]
 
+        Agents with the same provider settings and API key share one
+        provider (and so one HTTP client). Keys are compared by a blake2b
+        fingerprint, so the cache never holds a plaintext key. Providers are
+        rebuilt once the config is reloaded or the agent's API key changes.
+        """
         agent_cfg = self.config.get_agent(agent_name)
-        
-        provider_config = ProviderConfig(
-            model_name=agent_cfg.model,
-            temperature=agent_cfg.temperature,
-            max_tokens=agent_cfg.max_tokens,
-            extra_params={"base_url": agent_cfg.base_url} if agent_cfg.base_url else {}
-        )
-
-        provider = ProviderFactory.create(
-            agent_cfg.provider,
-            provider_config,
-            api_key
+        version = self.config.version
+        key = (
+            version,
+            agent_cfg.provider.lower(),
+            agent_cfg.model,
+            agent_cfg.temperature,
+            agent_cfg.max_tokens,
+            agent_cfg.base_url,
+            hashlib.blake2b(api_key.encode(), digest_size=16).digest(),
         )
-        
-        self._provider_cache[agent_name] = provider
+        provider = self._provider_cache.get(key)
+        if provider is None:
+            provider_config = ProviderConfig(
+                model_name=agent_cfg.model,
+                temperature=agent_cfg.temperature,
+                max_tokens=agent_cfg.max_tokens,
+                extra_params={"base_url": agent_cfg.base_url} if agent_cfg.base_url else {}
+            )
+
+            provider = ProviderFactory.create(
+                agent_cfg.provider,
+                provider_config,
+                api_key
+            )
+            self._provider_cache[key] = provider
+
+        if self._agent_keys.get(agent_name) != key:
+            self._agent_keys[agent_name] = key
+            # Drop providers from an older config or that no agent uses any more
+            self._agent_keys = {a: k for a, k in self._agent_keys.items() if k[0] == version}
+            live = set(self._agent_keys.values())
+            self._provider_cache = {k: v for k, v in self._provider_cache.items() if k in live}
         return provider
 
     async def route_and_complete(
@@ -147,12 +180,11 @@ class AgentRouter:
 
         provider = self.get_provider_for_agent(agent_name, api_key)
         
-        # Prepare messages
-        messages = history + [{"role": "user", "content": cleaned_text}]
-        
+        # The provider gets its own list, so the caller's history is never
+        # modified and may change while the request is in flight.
         # We pass the agent's system prompt to the provider
         response = await provider.complete(
-            messages, 
+            [*history, {"role": "user", "content": cleaned_text}],
             system_prompt=agent_cfg.system_prompt
         )
         
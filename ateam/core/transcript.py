@@ -0,0 +1,71 @@
+"""
+Transcript Logging for A-Team CLI.
+
+This module writes an append-only JSONL transcript of each room next to its
+history.db. Records go through a buffered file handle, so appending a message
+costs no disk I/O on the response path; the buffer is written out when it
+fills up and on flush/close. SQLite remains the queryable store.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+import orjson
+
+# Buffered bytes before the transcript is written out
+_BUFFER_SIZE = 16 * 1024
+
+
+class TranscriptWriter:
+    """
+    Appends conversation messages to a room's transcript.jsonl.
+
+    Each line is one JSON object with timestamp, role, content and agent_tag.
+    The file is opened lazily on the first append.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize the transcript writer.
+
+        Args:
+            path: Path to the JSONL transcript file.
+        """
+        self.path = path
+        self._file: Optional[BinaryIO] = None
+
+    def append(self, role: str, content: str, agent_tag: Optional[str] = None) -> None:
+        """
+        Append a message to the transcript buffer.
+
+        Args:
+            role: Role of the sender (user, assistant, system)
+            content: Message content
+            agent_tag: Optional agent tag
+        """
+        if self._file is None:
+            # Held open across appends; closed in close()
+            self._file = open(self.path, "ab", buffering=_BUFFER_SIZE)  # noqa: SIM115
+        self._file.write(orjson.dumps({
+            "timestamp": datetime.utcnow().isoformat(),
+            "role": role,
+            "content": content,
+            "agent_tag": agent_tag,
+        }) + b"\n")
+
+    def flush(self) -> None:
+        """Write buffered records to disk."""
+        if self._file is not None:
+            self._file.flush()
+
+    def clear(self) -> None:
+        """Discard buffered records and truncate the transcript."""
+        self.close()
+        self.path.write_bytes(b"")
+
+    def close(self) -> None:
+        """Flush and close the transcript file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -7,7 +7,7 @@ This module handles dynamic loading of custom tools from the mcp directory.
 import importlib.util
 import os
 from pathlib import Path
-from typing import List, Type
+from typing import Dict, List, Tuple, Type
 from ateam.tools.base import BaseTool
 
 
@@ -19,38 +19,62 @@ class PluginManager:
     def __init__(self, mcp_dir: str = "ateam/mcp"):
         self.mcp_dir = Path(mcp_dir)
         self.tools: List[BaseTool] = []
+        # Plugin file -> (mtime_ns, size, tools it defined) from the last load
+        self._cache: Dict[Path, Tuple[int, int, List[BaseTool]]] = {}
 
     def load_plugins(self) -> List[BaseTool]:
         """
         Walks the mcp directory and loads any class inheriting from BaseTool.
+
+        Files unchanged since the previous call keep their tool instances
+        instead of being executed again.
         """
-        if not self.mcp_dir.exists():
+        try:
+            with os.scandir(self.mcp_dir) as it:
+                entries = [e for e in it if e.name.endswith(".py") and e.name != "__init__.py"]
+        except OSError:
             return []
 
-        for file_path in self.mcp_dir.glob("*.py"):
-            if file_path.name == "__init__.py":
+        cache: Dict[Path, Tuple[int, int, List[BaseTool]]] = {}
+        for entry in entries:
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
                 continue
+            file_path = Path(entry.path)
+            cached = self._cache.get(file_path)
+            if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+                cached = (st.st_mtime_ns, st.st_size, self._load_file(file_path))
+            cache[file_path] = cached
 
-            # Load module dynamically
-            module_name = f"ateam.mcp.{file_path.stem}"
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                try:
-                    spec.loader.exec_module(module)
-                    
-                    # Find and instantiate classes that inherit from BaseTool
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if (isinstance(attr, type) and 
-                            issubclass(attr, BaseTool) and 
-                            attr is not BaseTool):
-                            try:
-                                tool_instance = attr()
-                                self.tools.append(tool_instance)
-                            except Exception as e:
-                                print(f"Error instantiating tool {attr_name}: {e}")
-                except Exception as e:
-                    print(f"Error loading plugin {file_path}: {e}")
-
+        self._cache = cache
+        self.tools = [tool for _, _, tools in cache.values() for tool in tools]
         return self.tools
+
+    def _load_file(self, file_path: Path) -> List[BaseTool]:
+        """Executes a plugin file and instantiates the BaseTool subclasses it defines."""
+        tools: List[BaseTool] = []
+
+        # Load module dynamically
+        module_name = f"ateam.mcp.{file_path.stem}"
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        if spec and spec.loader:
+            module = importlib.util.module_from_spec(spec)
+            try:
+                spec.loader.exec_module(module)
+                
+                # Find and instantiate classes that inherit from BaseTool
+                for attr_name, attr in vars(module).items():
+                    if (isinstance(attr, type) and 
+                        issubclass(attr, BaseTool) and 
+                        attr is not BaseTool):
+                        try:
+                            tools.append(attr())
+                        except Exception as e:
+                            print(f"Error instantiating tool {attr_name}: {e}")
+            except Exception as e:
+                print(f"Error loading plugin {file_path}: {e}")
+
+        return tools
@@ -2,11 +2,17 @@
 Unified AI Providers for A-Team CLI.
 """
 
-from typing import Optional, Type
+import importlib
+from typing import Dict, Tuple
 from ateam.providers.base import BaseProvider, ProviderConfig, CompletionResponse
-from ateam.providers.gemini import GeminiProvider
-from ateam.providers.anthropic import AnthropicProvider
-from ateam.providers.openai import OpenAIProvider
+
+# Provider classes -> defining module, imported on first access (PEP 562) so
+# that only the SDK of a provider actually used gets loaded
+_LAZY = {
+    "GeminiProvider": "ateam.providers.gemini",
+    "AnthropicProvider": "ateam.providers.anthropic",
+    "OpenAIProvider": "ateam.providers.openai",
+}
 
 __all__ = [
     "BaseProvider",
@@ -19,15 +25,29 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 class ProviderFactory:
     """
     Factory class to instantiate AI providers based on their name.
     """
 
-    _PROVIDERS = {
-        "gemini": GeminiProvider,
-        "anthropic": AnthropicProvider,
-        "openai": OpenAIProvider,
+    # Provider name -> (module, class name); the module is imported by create()
+    _PROVIDERS: Dict[str, Tuple[str, str]] = {
+        "gemini": ("ateam.providers.gemini", "GeminiProvider"),
+        "anthropic": ("ateam.providers.anthropic", "AnthropicProvider"),
+        "openai": ("ateam.providers.openai", "OpenAIProvider"),
     }
 
     @classmethod
@@ -51,11 +71,13 @@ class ProviderFactory:
         Raises:
             ValueError: If the provider name is unknown
         """
-        provider_class = cls._PROVIDERS.get(provider_name.lower())
-        if not provider_class:
+        target = cls._PROVIDERS.get(provider_name.lower())
+        if not target:
             valid = ", ".join(cls._PROVIDERS.keys())
             raise ValueError(
                 f"Unknown provider '{provider_name}'. Valid options: {valid}"
             )
         
+        module, class_name = target
+        provider_class = getattr(importlib.import_module(module), class_name)
         return provider_class(config, api_key)
@@ -2,7 +2,7 @@
 Anthropic Claude Provider for A-Team CLI.
 """
 
-from typing import Any, Dict, List, Optional, AsyncIterator
+from typing import Any, Dict, List, Optional, AsyncIterator, Tuple
 import anthropic
 from ateam.providers.base import BaseProvider, ProviderConfig, CompletionResponse
 
@@ -16,16 +16,42 @@ class AnthropicProvider(BaseProvider):
         super().__init__(config, api_key)
         self.client = anthropic.AsyncAnthropic(api_key=self.api_key)
 
+    def _with_cache_control(
+        self, 
+        messages: List[Dict[str, str]], 
+        system_prompt: Optional[str] = None
+    ) -> Tuple[Any, List[Dict[str, Any]]]:
+        """
+        Mark the system prompt and the newest message as prompt-cache breakpoints.
+
+        The next turn re-sends the same prefix plus new messages, so it is
+        served from the cache up to the previous breakpoint.
+        """
+        ephemeral = {"type": "ephemeral"}
+        system: Any = anthropic.NOT_GIVEN
+        if system_prompt:
+            system = [{"type": "text", "text": system_prompt, "cache_control": ephemeral}]
+
+        formatted: List[Dict[str, Any]] = list(messages)
+        if formatted:
+            last = formatted[-1]
+            formatted[-1] = {
+                "role": last["role"],
+                "content": [{"type": "text", "text": last["content"], "cache_control": ephemeral}],
+            }
+        return system, formatted
+
     async def complete(
         self, 
         messages: List[Dict[str, str]], 
         system_prompt: Optional[str] = None
     ) -> CompletionResponse:
         """Get a non-streaming completion from Claude."""
+        system, messages = self._with_cache_control(messages, system_prompt)
         response = await self.client.messages.create(
             model=self.config.model_name,
             max_tokens=self.config.max_tokens or 4096,
-            system=system_prompt or anthropic.NOT_GIVEN,
+            system=system,
             messages=messages,
             temperature=self.config.temperature,
             top_p=self.config.top_p or anthropic.NOT_GIVEN,
@@ -33,10 +59,7 @@ class AnthropicProvider(BaseProvider):
         )
 
         # Anthropic provides content as a list of content blocks
-        text = ""
-        for block in response.content:
-            if block.type == "text":
-                text += block.text
+        text = "".join(block.text for block in response.content if block.type == "text")
 
         return CompletionResponse(
             content=text,
@@ -53,10 +76,11 @@ class AnthropicProvider(BaseProvider):
         system_prompt: Optional[str] = None
     ) -> AsyncIterator[str]:
         """Stream response from Claude."""
+        system, messages = self._with_cache_control(messages, system_prompt)
         async with self.client.messages.stream(
             model=self.config.model_name,
             max_tokens=self.config.max_tokens or 4096,
-            system=system_prompt or anthropic.NOT_GIVEN,
+            system=system,
             messages=messages,
             temperature=self.config.temperature,
             top_p=self.config.top_p or anthropic.NOT_GIVEN,
@@ -94,9 +94,10 @@ class BaseProvider(ABC):
         """
         Generic helper to prep messages, including system prompt.
         Concrete classes might override this based on API requirements.
+
+        Without a system prompt this is `messages` itself, so the result
+        must not be modified.
         """
-        formatted = []
         if system_prompt:
-            formatted.append({"role": "system", "content": system_prompt})
-        formatted.extend(messages)
-        return formatted
+            return [{"role": "system", "content": system_prompt}, *messages]
+        return messages
@@ -8,6 +8,10 @@ from google.generativeai.types import GenerateContentResponse
 
 from ateam.providers.base import BaseProvider, ProviderConfig, CompletionResponse
 
+# Models kept per provider for distinct system prompts (the prompt embeds the
+# workspace summary, so it changes as the workspace does)
+MODEL_CACHE_SIZE = 4
+
 
 class GeminiProvider(BaseProvider):
     """
@@ -17,10 +21,13 @@ class GeminiProvider(BaseProvider):
     def __init__(self, config: ProviderConfig, api_key: str) -> None:
         super().__init__(config, api_key)
         genai.configure(api_key=self.api_key)
+        self._generation_config = self._get_generation_config()
         self.model = genai.GenerativeModel(
             model_name=self.config.model_name,
-            generation_config=self._get_generation_config()
+            generation_config=self._generation_config
         )
+        # System prompt -> model with that system instruction, least recently used first
+        self._models: Dict[str, genai.GenerativeModel] = {}
 
     def _get_generation_config(self) -> Dict[str, Any]:
         """Convert ProviderConfig to Gemini GenerationConfig format."""
@@ -33,21 +40,36 @@ class GeminiProvider(BaseProvider):
         # Filter out None values
         return {k: v for k, v in cfg.items() if v is not None}
 
+    def _model_for(self, system_prompt: Optional[str]) -> genai.GenerativeModel:
+        """The model to use for a system prompt, built once per distinct prompt."""
+        # For Gemini 1.5, we handle system prompt via instruction attribute if provided
+        if not system_prompt:
+            return self.model
+        model = self._models.pop(system_prompt, None)
+        if model is None:
+            model = genai.GenerativeModel(
+                model_name=self.config.model_name,
+                generation_config=self._generation_config,
+                system_instruction=system_prompt
+            )
+            if len(self._models) >= MODEL_CACHE_SIZE:
+                del self._models[next(iter(self._models))]
+        self._models[system_prompt] = model
+        return model
+
     def _convert_messages(self, messages: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """
         Convert OpenAI-style messages to Gemini history format.
         Gemini uses 'parts' and 'role' (user/model).
         """
-        history = []
-        for msg in messages:
-            role = "user" if msg["role"] == "user" else "model"
-            if msg["role"] == "system":
-                # System prompts are handled during model initialization 
-                # or as specialized user messages in Gemini's older API.
-                # In 1.5+, System Instruction is a separate param.
-                continue
-            history.append({"role": role, "parts": [msg["content"]]})
-        return history
+        # System prompts are handled during model initialization 
+        # or as specialized user messages in Gemini's older API.
+        # In 1.5+, System Instruction is a separate param.
+        return [
+            {"role": "user" if msg["role"] == "user" else "model", "parts": [msg["content"]]}
+            for msg in messages
+            if msg["role"] != "system"
+        ]
 
     async def complete(
         self, 
@@ -55,25 +77,19 @@ class GeminiProvider(BaseProvider):
         system_prompt: Optional[str] = None
     ) -> CompletionResponse:
         """Get a non-streaming completion from Gemini."""
-        # For Gemini 1.5, we handle system prompt via instruction attribute if provided
-        if system_prompt:
-            self.model = genai.GenerativeModel(
-                model_name=self.config.model_name,
-                generation_config=self._get_generation_config(),
-                system_instruction=system_prompt
-            )
+        model = self._model_for(system_prompt)
 
         history = self._convert_messages(messages)
         # The last message is the "prompt", others are "history"
         prompt = history.pop()["parts"][0]
-        chat = self.model.start_chat(history=history)
+        chat = model.start_chat(history=history)
         
         # NOTE: genai does not have a native async client in the standard SDK yet
         # but we wrap it in a pseudo-async call for consistency.
         # In a real heavy-load app, we'd use a thread pool.
-        response: GenerateContentResponse = await self.model.generate_content_async(
+        response: GenerateContentResponse = await model.generate_content_async(
             prompt,
-            generation_config=self._get_generation_config()
+            generation_config=self._generation_config
         )
 
         return CompletionResponse(
@@ -88,20 +104,15 @@ class GeminiProvider(BaseProvider):
         system_prompt: Optional[str] = None
     ) -> AsyncIterator[str]:
         """Stream response from Gemini."""
-        if system_prompt:
-            self.model = genai.GenerativeModel(
-                model_name=self.config.model_name,
-                generation_config=self._get_generation_config(),
-                system_instruction=system_prompt
-            )
+        model = self._model_for(system_prompt)
 
         history = self._convert_messages(messages)
         prompt = history.pop()["parts"][0]
-        chat = self.model.start_chat(history=history)
+        chat = model.start_chat(history=history)
 
-        response = await self.model.generate_content_async(
+        response = await model.generate_content_async(
             prompt,
-            generation_config=self._get_generation_config(),
+            generation_config=self._generation_config,
             stream=True
         )
 
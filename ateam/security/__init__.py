@@ -1,19 +1,32 @@
 """Security components: API key management, input validation, rate limiting."""
 
-from ateam.security.api_keys import SecureAPIKeyManager
-from ateam.security.validation import InputValidator, MessageInput, RoomNameInput, AgentNameInput
-from ateam.security.rate_limiter import RateLimiter, RateLimitConfig
-from ateam.security.trust import TrustManager
-from ateam.security.critic import ShadowCritic
+import importlib
 
-__all__ = [
-    "SecureAPIKeyManager",
-    "InputValidator",
-    "MessageInput",
-    "RoomNameInput",
-    "AgentNameInput",
-    "RateLimiter",
-    "RateLimitConfig",
-    "TrustManager",
-    "ShadowCritic",
-]
+# Public names -> defining module, imported on first access (PEP 562); the
+# critic pulls in every provider SDK, which validation users never need
+_LAZY = {
+    "SecureAPIKeyManager": "ateam.security.api_keys",
+    "InputValidator": "ateam.security.validation",
+    "MessageInput": "ateam.security.validation",
+    "RoomNameInput": "ateam.security.validation",
+    "AgentNameInput": "ateam.security.validation",
+    "RateLimiter": "ateam.security.rate_limiter",
+    "RateLimitConfig": "ateam.security.rate_limiter",
+    "TrustManager": "ateam.security.trust",
+    "ShadowCritic": "ateam.security.critic",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -14,12 +14,40 @@ Security features:
 - Rotation reminders
 """
 
+import functools
 import os
 import re
-from typing import Optional
+from typing import Dict, FrozenSet, Optional, Tuple
 
-import keyring
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+# Imported on first use: loading keyring and picking a backend probes D-Bus
+keyring = None
+
+
+def _keyring():
+    """The keyring module, imported on first call."""
+    global keyring
+    if keyring is None:
+        import keyring as keyring_module
+        keyring = keyring_module
+    return keyring
+
+
+# A single entry: the cache holds raw keys, and the set in use rarely changes
+@functools.lru_cache(maxsize=1)
+def _redaction_pattern(keys: FrozenSet[str]) -> Tuple[Optional["re.Pattern[str]"], Dict[str, str]]:
+    """
+    One pattern matching any of `keys`, and each key's redacted form.
+
+    Longer keys come first in the alternation, so a key that contains
+    another is redacted whole.
+    """
+    keys = sorted((key for key in keys if key), key=len, reverse=True)
+    if not keys:
+        return None, {}
+    pattern = re.compile("|".join(map(re.escape, keys)))
+    return pattern, {key: SecureAPIKeyManager.redact_key(key) for key in keys}
 
 
 class APIKeyConfig(BaseModel):
@@ -27,8 +55,16 @@ class APIKeyConfig(BaseModel):
 
     provider: str = Field(..., description="Provider name (gemini, anthropic, openai, ollama)")
     env_var: str = Field(..., description="Environment variable name")
+    account: str = Field("", description="Keyring account name the key is stored under")
     validate_url: Optional[str] = Field(None, description="URL to validate the key")
 
+    @model_validator(mode="after")
+    def _default_account(self) -> "APIKeyConfig":
+        """Accounts default to "<provider>_api_key"."""
+        if not self.account:
+            self.account = f"{self.provider}_api_key"
+        return self
+
 
 class SecureAPIKeyManager:
     """
@@ -74,10 +110,6 @@ class SecureAPIKeyManager:
         ),
     }
 
-    def __init__(self) -> None:
-        """Initialize the API key manager."""
-        self.keyring_backend = keyring.get_keyring()
-
     def store_key(self, provider: str, api_key: str) -> None:
         """
         Store an API key securely in the system keyring.
@@ -99,7 +131,7 @@ class SecureAPIKeyManager:
             raise ValueError("API key cannot be empty")
 
         # Store in keyring
-        keyring.set_password(self.SERVICE_NAME, f"{provider}_api_key", api_key)
+        _keyring().set_password(self.SERVICE_NAME, self.PROVIDERS[provider].account, api_key)
 
     def get_key(self, provider: str, config_value: Optional[str] = None) -> Optional[str]:
         """
@@ -123,7 +155,7 @@ class SecureAPIKeyManager:
         config = self.PROVIDERS[provider]
 
         # 1. Try keyring (most secure)
-        key = keyring.get_password(self.SERVICE_NAME, f"{provider}_api_key")
+        key = _keyring().get_password(self.SERVICE_NAME, config.account)
         if key:
             return key
 
@@ -146,9 +178,14 @@ class SecureAPIKeyManager:
         Args:
             provider: Provider name (gemini, anthropic, openai, ollama)
         """
+        if provider not in self.PROVIDERS:
+            # store_key never stores keys for unknown providers
+            return
+
+        kr = _keyring()
         try:
-            keyring.delete_password(self.SERVICE_NAME, f"{provider}_api_key")
-        except keyring.errors.PasswordDeleteError:
+            kr.delete_password(self.SERVICE_NAME, self.PROVIDERS[provider].account)
+        except kr.errors.PasswordDeleteError:
             # Key doesn't exist, that's fine
             pass
 
@@ -159,9 +196,10 @@ class SecureAPIKeyManager:
         Returns:
             List of provider names with stored keys
         """
+        kr = _keyring()
         stored = []
-        for provider in self.PROVIDERS:
-            if keyring.get_password(self.SERVICE_NAME, f"{provider}_api_key"):
+        for provider, config in self.PROVIDERS.items():
+            if kr.get_password(self.SERVICE_NAME, config.account):
                 stored.append(provider)
         return stored
 
@@ -216,12 +254,10 @@ class SecureAPIKeyManager:
             >>> print(filtered)
             "Error: Invalid key sk-abc12345...xyz"
         """
-        filtered_text = text
-        for key in keys:
-            if key and key in filtered_text:
-                redacted = SecureAPIKeyManager.redact_key(key)
-                filtered_text = filtered_text.replace(key, redacted)
-        return filtered_text
+        pattern, redactions = _redaction_pattern(frozenset(keys))
+        if pattern is None:
+            return text
+        return pattern.sub(lambda m: redactions[m.group(0)], text)
 
     def get_env_var_name(self, provider: str) -> Optional[str]:
         """
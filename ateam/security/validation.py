@@ -19,6 +19,13 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+# Patterns are compiled once at import; validators run on every user turn.
+_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+_NEWLINE_RUN_RE = re.compile(r"\n{4,}")
+_SQL_IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]")
+_RESERVED_ROOM_NAMES = frozenset({".", "..", "con", "prn", "aux", "nul"})
+
 
 class MessageInput(BaseModel):
     """Validation schema for user messages."""
@@ -35,14 +42,13 @@ class MessageInput(BaseModel):
             raise ValueError("Message cannot contain null bytes")
 
         # Normalize excessive whitespace
-        lines = v.split("\n")
-        if len(lines) > 1000:
+        if v.count("\n") >= 1000:
             raise ValueError("Message cannot exceed 1000 lines")
 
         # Check for excessive consecutive newlines
         if "\n\n\n\n" in v:
             # Normalize to max 3 consecutive newlines
-            v = re.sub(r"\n{4,}", "\n\n\n", v)
+            v = _NEWLINE_RUN_RE.sub("\n\n\n", v)
 
         return v
 
@@ -54,7 +60,7 @@ class MessageInput(BaseModel):
             return v
 
         # Only alphanumeric, hyphens, underscores
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
+        if not _NAME_RE.match(v):
             raise ValueError(
                 "Agent tag can only contain letters, numbers, hyphens, and underscores"
             )
@@ -76,12 +82,11 @@ class RoomNameInput(BaseModel):
             raise ValueError("Room name cannot contain null bytes")
 
         # Block reserved names
-        reserved = {".", "..", "con", "prn", "aux", "nul"}
-        if v.lower() in reserved:
+        if v.lower() in _RESERVED_ROOM_NAMES:
             raise ValueError(f"Room name '{v}' is reserved")
 
         # Only alphanumeric, hyphens, underscores
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
+        if not _NAME_RE.match(v):
             raise ValueError(
                 "Room name can only contain letters, numbers, hyphens, and underscores"
             )
@@ -103,7 +108,7 @@ class AgentNameInput(BaseModel):
             raise ValueError("Agent name cannot contain null bytes")
 
         # Only alphanumeric, hyphens, underscores
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
+        if not _NAME_RE.match(v):
             raise ValueError(
                 "Agent name can only contain letters, numbers, hyphens, and underscores"
             )
@@ -162,10 +167,11 @@ class InputValidator:
         r"id_rsa",
         r"credentials",
     ]
+    _BLOCKED_REGEX = re.compile("|".join(BLOCKED_PATTERNS), re.IGNORECASE)
 
     def __init__(self) -> None:
         """Initialize the input validator."""
-        self.blocked_regex = re.compile("|".join(self.BLOCKED_PATTERNS), re.IGNORECASE)
+        self.blocked_regex = self._BLOCKED_REGEX
 
     def validate_message(self, content: str, agent_tag: Optional[str] = None) -> MessageInput:
         """
@@ -317,7 +323,7 @@ class InputValidator:
         if not identifier:
             raise ValueError("SQL identifier cannot be empty")
 
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", identifier):
+        if not _SQL_IDENTIFIER_RE.match(identifier):
             raise ValueError(
                 "SQL identifier can only contain letters, numbers, and underscores, "
                 "and must start with a letter or underscore"
@@ -361,7 +367,7 @@ class InputValidator:
             "HelloWorld"
         """
         # Remove null bytes and control characters (except newline/tab)
-        sanitized = re.sub(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]", "", text)
+        sanitized = _CONTROL_CHARS_RE.sub("", text)
 
         # Normalize whitespace
         sanitized = " ".join(sanitized.split())
@@ -2,6 +2,7 @@
 File handling tools for A-Team CLI.
 """
 
+import asyncio
 import os
 from pathlib import Path
 from typing import Any, Dict
@@ -28,7 +29,7 @@ class FileReadTool(BaseTool):
             if not safe_path.is_file():
                 return f"Error: '{path}' is a directory, not a file."
                 
-            return safe_path.read_text(encoding="utf-8")
+            return await asyncio.to_thread(safe_path.read_text, encoding="utf-8")
         except Exception as e:
             return f"Error reading file: {str(e)}"
 
@@ -49,7 +50,7 @@ class FileWriteTool(BaseTool):
             # Ensure parent directory exists
             safe_path.parent.mkdir(parents=True, exist_ok=True)
             
-            safe_path.write_text(content, encoding="utf-8")
+            await asyncio.to_thread(safe_path.write_text, content, encoding="utf-8")
             return f"Successfully wrote to {path}"
         except Exception as e:
             return f"Error writing file: {str(e)}"
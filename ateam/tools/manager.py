@@ -64,6 +64,10 @@ class ToolManager:
         Extract tool calls and their arguments.
         Returns a list of dicts: {"name": str, "args": dict, "body": str}
         """
+        # Most responses contain no tool call; a substring check skips the regex
+        if "<tool_call" not in text:
+            return []
+
         calls = []
         for attr_str, body in self.TOOL_PATTERN.findall(text):
             attrs = dict(self.ATTR_PATTERN.findall(attr_str))
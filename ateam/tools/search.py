@@ -5,7 +5,7 @@ Search tools for A-Team CLI.
 import os
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from ateam.tools.base import BaseTool
 from ateam.security.validation import InputValidator
 
@@ -22,6 +22,14 @@ class SearchTool(BaseTool):
         self.ignored_dirs = {".git", "__pycache__", ".venv", ".pytest_cache", "node_modules", ".context"}
         self.ignored_exts = {".pyc", ".pyo", ".pyd", ".so", ".dll", ".exe", ".bin", ".lock"}
 
+    def _iter_files(self, root: Path) -> Iterator[Path]:
+        """Files under root, never descending into ignored directories."""
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Pruned in place, so os.walk skips these subtrees entirely
+            dirnames[:] = [d for d in dirnames if d not in self.ignored_dirs]
+            for filename in filenames:
+                yield Path(dirpath, filename)
+
     async def execute(self, query: str, **kwargs) -> str:
         """
         Search for query in the current workspace.
@@ -36,21 +44,17 @@ class SearchTool(BaseTool):
             count = 0
             max_results = 20
             
-            for path in root.rglob("*"):
+            for path in self._iter_files(root):
                 if count >= max_results:
                     results.append("\n... (more results found, please refine your search)")
                     break
-                    
-                # Skip ignored directories
-                if any(ignored in path.parts for ignored in self.ignored_dirs):
-                    continue
-                    
-                # Skip directories and non-text files
-                if not path.is_file() or path.suffix in self.ignored_exts:
+
+                # Skip non-text and special files
+                if path.suffix in self.ignored_exts or not path.is_file():
                     continue
                 
                 try:
-                    # Validate path (though rglob should be safe relative to root)
+                    # Validate path (though the walk should be safe relative to root)
                     self.validator.validate_file_path(str(path), allowed_paths=[os.getcwd()])
                 except ValueError:
                     continue
@@ -0,0 +1,31 @@
+"""
+Atomic file writes for A-Team CLI.
+
+Caches and room metadata can be written by several `ateam` processes at
+once, so each write goes through its own temp file before being renamed
+into place.
+"""
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Replace `path` with `data` in one step.
+
+    The temp file is unique and lives in the same directory, so concurrent
+    writers never share it and os.replace stays a same-filesystem rename.
+    Readers see either the old file or the new one, never a partial write.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
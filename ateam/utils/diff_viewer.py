@@ -3,7 +3,8 @@ Diff Visualization for A-Team CLI.
 """
 
 import difflib
-from rich.console import Console
+from typing import List
+from rich.console import Console, RenderableType
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
@@ -20,9 +21,16 @@ class DiffViewer:
         """
         Displays a side-by-side or unified diff of a proposed file change.
         """
+        for renderable in DiffViewer.build_diff(path, old_content, new_content):
+            console.print(renderable)
+
+    @staticmethod
+    def build_diff(path: str, old_content: str, new_content: str) -> List[RenderableType]:
+        """
+        Computes the diff renderables without printing, so it can run off the event loop.
+        """
         if old_content == new_content:
-            console.print(f"[yellow]No changes proposed for {path}.[/yellow]")
-            return
+            return [f"[yellow]No changes proposed for {path}.[/yellow]"]
 
         diff_lines = list(difflib.unified_diff(
             old_content.splitlines(keepends=True),
@@ -32,8 +40,7 @@ class DiffViewer:
         ))
 
         if not diff_lines:
-            console.print(f"[yellow]No structural changes proposed for {path}.[/yellow]")
-            return
+            return [f"[yellow]No structural changes proposed for {path}.[/yellow]"]
 
         table = Table(title=f"📝 Proposed Changes: {path}", show_header=True, header_style="bold magenta", expand=True)
         table.add_column("Type", width=10)
@@ -48,11 +55,9 @@ class DiffViewer:
                 # Context lines - maybe show only a few?
                 pass
 
-        console.print(table)
-        
         # Also provide a 'Syntax' view of the new content for context
-        console.print(Panel(
+        return [table, Panel(
             Syntax(new_content, lexer="python", line_numbers=True, theme="monokai", word_wrap=True),
             title="Full Content Preview",
             border_style="dim"
-        ))
+        )]
@@ -31,6 +31,17 @@ class TestSecureAPIKeyManager:
         with patch("ateam.security.api_keys.keyring") as mock:
             yield mock
 
+    def test_keyring_imported_on_first_use(self) -> None:
+        """Test that creating the manager doesn't load keyring."""
+        import subprocess
+        import sys
+        code = (
+            "import sys; from ateam.security import SecureAPIKeyManager; "
+            "SecureAPIKeyManager(); print('keyring' in sys.modules)"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert out.strip() == "False"
+
     def test_store_key_valid_provider(self, manager: SecureAPIKeyManager, mock_keyring) -> None:
         """Test storing a key for a valid provider."""
         manager.store_key("gemini", "test-api-key-12345")
@@ -161,6 +172,19 @@ class TestSecureAPIKeyManager:
         assert "sk-key12345...abc" in filtered
         assert "sk-xyz98765...def" in filtered
 
+    def test_filter_overlapping_keys_from_text(self) -> None:
+        """Test that a key containing another key is redacted whole."""
+        short = "sk-abc123456789"
+        long = short + "xyz000"
+        text = f"Keys: {long} and {short}."
+
+        filtered = SecureAPIKeyManager.filter_keys_from_text(text, [short, long, ""])
+
+        assert filtered == (
+            f"Keys: {SecureAPIKeyManager.redact_key(long)} and {SecureAPIKeyManager.redact_key(short)}."
+        )
+        assert SecureAPIKeyManager.filter_keys_from_text(text, []) == text
+
     def test_get_env_var_name(self, manager: SecureAPIKeyManager) -> None:
         """Test getting environment variable name for a provider."""
         assert manager.get_env_var_name("gemini") == "GOOGLE_API_KEY"
@@ -0,0 +1,46 @@
+"""
+Tests for atomic file writes.
+"""
+
+import pytest
+
+from ateam.utils import atomic
+from ateam.utils.atomic import atomic_write_bytes
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_bytes(b"old")
+
+    atomic_write_bytes(path, b"new")
+    assert path.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_atomic_write_uses_unique_temp_files(tmp_path, monkeypatch):
+    path = tmp_path / "data.json"
+    temps = []
+    replace = atomic.os.replace
+
+    def record(src, dst):
+        temps.append(src)
+        replace(src, dst)
+
+    monkeypatch.setattr(atomic.os, "replace", record)
+    atomic_write_bytes(path, b"a")
+    atomic_write_bytes(path, b"b")
+    assert len(set(temps)) == 2
+
+
+def test_atomic_write_failure_keeps_old_file(tmp_path, monkeypatch):
+    path = tmp_path / "data.json"
+    path.write_bytes(b"old")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(atomic.os, "replace", fail)
+    with pytest.raises(OSError):
+        atomic_write_bytes(path, b"new")
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
@@ -87,3 +87,37 @@ class TestContextManager:
         assert usage["total_tokens"] == 17
         assert usage["max_tokens"] == 100
         assert usage["usage_percent"] == 17
+
+    def test_trimmed_context_accepts_iterable(self):
+        """Test that messages can be streamed in without building a list first."""
+        cm = ContextManager(max_tokens=100, preserve_first_n=1)
+        rows = (("user" if i % 2 == 0 else "assistant", f"Msg {i}") for i in range(6))
+
+        trimmed = cm.get_trimmed_context(({"role": r, "content": c} for r, c in rows), system_prompt="S")
+        assert trimmed[0]["role"] == "system"
+        assert [m["content"] for m in trimmed[1:]] == [f"Msg {i}" for i in range(6)]
+
+    def test_append_and_trim_incremental(self):
+        """Test that appending evicts the oldest messages once over budget."""
+        # Each message is 25 + 4 = 29 tokens. Max 70 leaves 67 after baseline: 2 messages fit.
+        cm = ContextManager(max_tokens=70)
+
+        window, tokens = cm.append_and_trim([], 0, [{"role": "user", "content": "1" * 100}])
+        assert len(window) == 1
+        assert tokens == 29
+
+        window, tokens = cm.append_and_trim(
+            window, tokens,
+            [{"role": "assistant", "content": "2" * 100}, {"role": "user", "content": "3" * 100}]
+        )
+        assert [m["content"][0] for m in window] == ["2", "3"]
+        assert tokens == 58
+
+    def test_append_and_trim_max_messages(self):
+        """Test that the message cap is honoured."""
+        cm = ContextManager(max_tokens=1000)
+        new = [{"role": "user", "content": str(i)} for i in range(5)]
+
+        window, tokens = cm.append_and_trim([], 0, new, max_messages=3)
+        assert [m["content"] for m in window] == ["2", "3", "4"]
+        assert tokens == 15
@@ -48,6 +48,15 @@ class TestHistoryManager:
         assert cursor.fetchone() is not None
         conn.close()
 
+    def test_init_enables_wal(self, temp_db_path):
+        """Test that the database is switched to write-ahead logging."""
+        HistoryManager(temp_db_path)
+
+        import sqlite3
+        conn = sqlite3.connect(temp_db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
     def test_add_message(self, manager: HistoryManager):
         """Test adding a message."""
         msg = manager.add_message(role="user", content="Hello, test!", agent_tag="User")
@@ -58,6 +67,35 @@ class TestHistoryManager:
         assert msg.agent_tag == "User"
         assert isinstance(msg.timestamp, datetime)
 
+    def test_add_messages(self, manager: HistoryManager):
+        """Test adding several messages in one transaction."""
+        msgs = manager.add_messages([
+            ("user", "Question", None),
+            ("assistant", "Answer", "Coder"),
+        ])
+
+        assert [m.role for m in msgs] == ["user", "assistant"]
+        assert msgs[1].id == msgs[0].id + 1
+        assert msgs[1].agent_tag == "Coder"
+        assert [m.content for m in manager.get_history()] == ["Question", "Answer"]
+
+        # Returned IDs match the stored rows
+        more = manager.add_messages([("user", "Again", None), ("assistant", "Sure", "Coder")])
+        assert [m.id for m in manager.get_history()] == [m.id for m in msgs + more]
+        assert manager.add_messages([]) == []
+
+    def test_iter_display_rows(self, manager: HistoryManager):
+        """Test display rows are the most recent messages as plain tuples."""
+        for i in range(5):
+            manager.add_message("user", f"Msg {i}")
+        manager.add_message("assistant", "Reply", agent_tag="Coder")
+
+        rows = list(manager.iter_display_rows(limit=3))
+        assert rows == [("user", "Msg 3", None), ("user", "Msg 4", None), ("assistant", "Reply", "Coder")]
+
+        newest = list(manager.iter_display_rows(limit=3, newest_first=True))
+        assert newest == rows[::-1]
+
     def test_get_history(self, manager: HistoryManager):
         """Test retrieving history."""
         manager.add_message("user", "Msg 1")
@@ -97,6 +135,44 @@ class TestHistoryManager:
         assert last_3[1].content == "Msg 8"
         assert last_3[2].content == "Msg 9"
 
+    def test_get_context_dicts(self, manager: HistoryManager):
+        """Test retrieving provider-ready dicts with roles mapped."""
+        manager.add_message("user", "Question")
+        manager.add_message("assistant", "Answer")
+        last = manager.add_message("system", "Tool result")
+
+        dicts, last_id = manager.get_context_dicts()
+        assert dicts == [
+            {"role": "user", "content": "Question"},
+            {"role": "assistant", "content": "Answer"},
+            {"role": "user", "content": "Tool result"},
+        ]
+        assert last_id == last.id
+        # Role strings are shared, not allocated per row
+        assert dicts[0]["role"] is dicts[2]["role"]
+
+        # Nothing newer than the last ID
+        assert manager.get_context_dicts(after_id=last_id) == ([], last_id)
+
+    def test_connection_per_thread(self, manager: HistoryManager):
+        """Test that each thread reuses its own connection until close()."""
+        import threading
+
+        conn = manager._get_connection()
+        assert manager._get_connection() is conn
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(manager._get_connection()))
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+        manager.close()
+        # Usable again after closing, on a fresh connection
+        manager.add_message("user", "After close")
+        assert manager._get_connection() is not conn
+        assert manager.get_message_count() == 1
+
     def test_clear_history(self, manager: HistoryManager):
         """Test clearing the history."""
         manager.add_message("user", "Kill me")
@@ -116,6 +192,32 @@ class TestHistoryManager:
         assert "needle" in results[0].content
         assert "needle" in results[1].content
 
+    def test_search_messages_index(self, temp_db_path):
+        """Test that search indexes older rows and matches substrings case-insensitively."""
+        import sqlite3
+        conn = sqlite3.connect(temp_db_path)
+        conn.execute(
+            "CREATE TABLE messages (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, "
+            "role TEXT NOT NULL, content TEXT NOT NULL, agent_tag TEXT, tokens INTEGER DEFAULT 0)"
+        )
+        conn.execute(
+            "INSERT INTO messages (timestamp, role, content) VALUES ('2024-01-01T00:00:00', 'user', 'Old Needle')"
+        )
+        conn.commit()
+        conn.close()
+
+        manager = HistoryManager(temp_db_path)
+        manager.add_message("user", 'A "needles" pile')
+        manager.add_message("user", "hay")
+
+        assert [m.content for m in manager.search_messages("NEEDLE")] == ['A "needles" pile', "Old Needle"]
+        assert [m.content for m in manager.search_messages('"needles"')] == ['A "needles" pile']
+        # Shorter than a trigram
+        assert [m.content for m in manager.search_messages("ay")] == ["hay"]
+
+        manager.clear_history()
+        assert manager.search_messages("needle") == []
+
     def test_message_to_dict(self):
         """Test converting Message to dictionary for API providers."""
         msg = Message(role="user", content="Test dict")
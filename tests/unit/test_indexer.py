@@ -24,6 +24,73 @@ def helper():
     assert "Class: Calculator (Methods: add, sub)" in items
     assert "Function: helper" in items
 
+def test_indexer_python_nesting(tmp_path):
+    (tmp_path / "shapes.py").write_text('''
+import math
+
+@dataclass
+class Circle(
+    Shape,
+):
+    """
+    Example:
+        def not_a_method(): ...
+    """
+
+    radius: float
+
+    def area(self):
+        def square(x):
+            return x * x
+        return math.pi * square(self.radius)
+
+    class Meta:
+        def nested(self):
+            pass
+
+    async def load(self):
+        pass
+
+if DEBUG:
+    def debug_only():
+        pass
+
+SQL = """
+def not_real():
+"""
+
+class Config:
+    """Settings.
+Continued at column 0.
+"""
+    def load(self):
+        pass
+
+def unit():
+    return Circle(1)
+''', encoding="utf-8")
+
+    indexer = WorkspaceIndexer(root_dir=tmp_path)
+    indexer.refresh()
+
+    assert indexer.index["shapes.py"] == [
+        "Class: Circle (Methods: area)",
+        "Class: Config (Methods: load)",
+        "Function: unit",
+    ]
+
+def test_indexer_skips_large_files(tmp_path, monkeypatch):
+    (tmp_path / "small.py").write_bytes(b"def ok():\n    return '\xff'\n")
+    (tmp_path / "bundle.py").write_text("def big():\n    pass\n" + "#" * 200, encoding="utf-8")
+    monkeypatch.setattr("ateam.core.indexer.MAX_INDEXED_FILE_SIZE", 100)
+
+    indexer = WorkspaceIndexer(root_dir=tmp_path)
+    indexer.refresh()
+
+    # Undecodable bytes don't drop a file; oversized files are never read
+    assert indexer.index == {"small.py": ["Function: ok"]}
+    assert "bundle.py" in indexer._files
+
 def test_indexer_markdown(tmp_path):
     md_file = tmp_path / "README.md"
     md_file.write_text("""
@@ -48,3 +115,80 @@ def test_indexer_summary(tmp_path):
     summary = indexer.get_summary()
     assert "test.txt" in summary
     assert "# Test Header" in summary
+
+def test_indexer_version_bumps_on_change(tmp_path):
+    py_file = tmp_path / "logic.py"
+    py_file.write_text("def helper():\n    pass\n", encoding="utf-8")
+
+    indexer = WorkspaceIndexer(root_dir=tmp_path)
+    assert indexer.version == 0
+
+    indexer.refresh()
+    indexer.refresh()
+    assert indexer.version == 1
+
+    py_file.write_text("def helper():\n    pass\n\ndef other():\n    pass\n", encoding="utf-8")
+    indexer.refresh()
+    assert indexer.version == 2
+    assert "Function: other" in indexer.index["logic.py"]
+
+def test_indexer_skips_ignored_and_unchanged(tmp_path, monkeypatch):
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.py").write_text("def dep():\n    pass\n", encoding="utf-8")
+    (tmp_path / "app.py").write_text("def main():\n    pass\n", encoding="utf-8")
+
+    indexer = WorkspaceIndexer(root_dir=tmp_path)
+    indexer.refresh()
+    assert list(indexer.index) == ["app.py"]
+
+    def fail(path):
+        raise AssertionError(f"{path} re-parsed")
+
+    monkeypatch.setattr(indexer, "_index_python", fail)
+    indexer.refresh()
+    assert list(indexer.index) == ["app.py"]
+
+def test_indexer_cache_roundtrip(tmp_path):
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    (workspace / "app.py").write_text("class App:\n    def run(self):\n        pass\n", encoding="utf-8")
+    cache_path = tmp_path / "cache" / "index.json"
+
+    indexer = WorkspaceIndexer(root_dir=workspace, cache_path=cache_path)
+    indexer.refresh()
+    # Written through a temp file that doesn't outlive the save
+    assert [p.name for p in cache_path.parent.iterdir()] == ["index.json"]
+
+    restored = WorkspaceIndexer(root_dir=workspace, cache_path=cache_path)
+    assert restored.load_cached()
+    assert restored.index == indexer.index
+    assert restored.get_summary() == indexer.get_summary()
+
+def test_indexer_default_cache_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    path = WorkspaceIndexer.default_cache_path(str(tmp_path))
+    assert path.parent == tmp_path / "home" / ".cache" / "ateam" / "index"
+    assert path == WorkspaceIndexer.default_cache_path(str(tmp_path / "."))
+    assert path != WorkspaceIndexer.default_cache_path(str(tmp_path / "other"))
+
+def test_find_relevant_files(tmp_path):
+    (tmp_path / "calculator.py").write_text(
+        "class Calculator:\n    def add_numbers(self):\n        pass\n", encoding="utf-8"
+    )
+    (tmp_path / "README.md").write_text("# Calculator usage\n", encoding="utf-8")
+    (tmp_path / "other.py").write_text("def unrelated():\n    pass\n", encoding="utf-8")
+
+    indexer = WorkspaceIndexer(root_dir=tmp_path)
+    indexer.refresh()
+
+    assert sorted(indexer.find_relevant_files("calc")) == ["README.md", "calculator.py"]
+    assert sorted(indexer.find_relevant_files("Methods: add_num")) == ["calculator.py"]
+    assert sorted(indexer.find_relevant_files("tor.p")) == ["calculator.py"]
+    assert sorted(indexer.find_relevant_files("tor usage")) == ["README.md"]
+    assert sorted(indexer.find_relevant_files("add numbers")) == []
+    assert sorted(indexer.find_relevant_files("e")) == ["README.md", "calculator.py", "other.py"]
+
+    # The token index follows refreshes
+    (tmp_path / "other.py").write_text("def calculate():\n    pass\n", encoding="utf-8")
+    indexer.refresh()
+    assert sorted(indexer.find_relevant_files("calc")) == ["README.md", "calculator.py", "other.py"]
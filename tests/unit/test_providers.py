@@ -42,6 +42,36 @@ class TestProviders:
         with pytest.raises(ValueError, match="Unknown provider"):
             ProviderFactory.create("unknown", config, "fake-key")
 
+    def test_message_formatting(self, config):
+        messages = [
+            {"role": "system", "content": "Rules"},
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello"},
+        ]
+        with patch("openai.AsyncOpenAI"):
+            openai_provider = OpenAIProvider(config, "fake-key")
+        assert openai_provider._format_messages(messages, "Be brief") == [
+            {"role": "system", "content": "Be brief"}, *messages
+        ]
+        assert openai_provider._format_messages(messages) == messages
+
+        with patch("google.generativeai.GenerativeModel"), patch("google.generativeai.configure"):
+            gemini_provider = GeminiProvider(config, "fake-key")
+        assert gemini_provider._convert_messages(messages) == [
+            {"role": "user", "parts": ["Hi"]},
+            {"role": "model", "parts": ["Hello"]},
+        ]
+
+    def test_import_does_not_load_sdks(self):
+        import subprocess
+        import sys
+        code = (
+            "import sys, ateam.providers; "
+            "print(sorted(m for m in ('openai', 'anthropic', 'google.generativeai') if m in sys.modules))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert out.strip() == "[]"
+
     @pytest.mark.asyncio
     async def test_openai_completion(self, config):
         with patch("openai.AsyncOpenAI") as mock_openai:
@@ -83,6 +113,33 @@ class TestProviders:
             assert response.content == "Hello from Claude"
             assert response.prompt_tokens == 8
 
+    @pytest.mark.asyncio
+    async def test_anthropic_prompt_cache_breakpoints(self, config):
+        with patch("anthropic.AsyncAnthropic") as mock_anthropic:
+            mock_client = mock_anthropic.return_value
+            mock_client.messages.create = AsyncMock()
+            mock_response = MagicMock()
+            mock_response.content = []
+            mock_response.usage.input_tokens = 0
+            mock_response.usage.output_tokens = 0
+            mock_client.messages.create.return_value = mock_response
+
+            messages = [
+                {"role": "user", "content": "Hi"},
+                {"role": "assistant", "content": "Hello"},
+                {"role": "user", "content": "Again"},
+            ]
+            provider = AnthropicProvider(config, "fake-key")
+            await provider.complete(messages, system_prompt="Be brief")
+
+            kwargs = mock_client.messages.create.call_args.kwargs
+            assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+            assert kwargs["messages"][:2] == messages[:2]
+            assert kwargs["messages"][-1]["content"][0]["text"] == "Again"
+            assert kwargs["messages"][-1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+            # The caller's list is not modified
+            assert messages[-1] == {"role": "user", "content": "Again"}
+
     @pytest.mark.asyncio
     async def test_gemini_completion(self, config):
         with patch("google.generativeai.GenerativeModel") as mock_model_class:
@@ -103,3 +160,26 @@ class TestProviders:
                 response = await provider.complete([{"role": "user", "content": "Hi"}])
                 
                 assert response.content == "Hello from Gemini"
+
+    @pytest.mark.asyncio
+    async def test_gemini_reuses_model_per_system_prompt(self, config):
+        with patch("google.generativeai.GenerativeModel") as mock_model_class, \
+                patch("google.generativeai.configure"), \
+                patch("ateam.providers.gemini.MODEL_CACHE_SIZE", 2):
+            mock_model_class.return_value.generate_content_async = AsyncMock(
+                return_value=MagicMock(text="ok")
+            )
+            provider = GeminiProvider(config, "fake-key")
+            messages = [{"role": "user", "content": "Hi"}]
+
+            await provider.complete(messages, system_prompt="Be brief")
+            await provider.complete(messages, system_prompt="Be brief")
+            await provider.complete(messages)
+            # One model at init, one for the system prompt
+            assert mock_model_class.call_count == 2
+
+            await provider.complete(messages, system_prompt="Be verbose")
+            await provider.complete(messages, system_prompt="Be terse")
+            # The least recently used prompt was evicted
+            assert list(provider._models) == ["Be verbose", "Be terse"]
+            assert mock_model_class.call_args.kwargs["system_instruction"] == "Be terse"
@@ -123,6 +123,21 @@ class TestRoomManager:
 
         assert metadata2.last_active > original_last_active
 
+    def test_join_coalesces_last_active_writes(self, manager: RoomManager, monkeypatch) -> None:
+        """Test that rejoining shortly after the last write leaves metadata.json alone."""
+        manager.create_room("my-project")
+        metadata_path = manager._get_metadata_path("my-project")
+        stored = metadata_path.read_bytes()
+
+        manager.join_room("my-project")
+        assert metadata_path.read_bytes() == stored
+
+        monkeypatch.setattr(RoomManager, "LAST_ACTIVE_WRITE_INTERVAL", 0.0)
+        metadata = manager.join_room("my-project")
+        assert manager.get_room_metadata("my-project").last_active == metadata.last_active
+        # The temp file used for the atomic write is gone
+        assert not list(metadata_path.parent.glob("*.tmp"))
+
     # ========================================================================
     # Room Leaving Tests
     # ========================================================================
@@ -236,6 +251,23 @@ class TestRoomManager:
         metadata = manager.get_room_metadata("my-project")
         assert metadata.description == "New description"
 
+    def test_add_message_count(self, manager: RoomManager) -> None:
+        """Test that message counts from separate sessions add up."""
+        manager.create_room("my-project")
+        other = RoomManager(base_dir=manager.base_dir)
+
+        manager.add_message_count("my-project", 2)
+        other.update_room_metadata("my-project", description="Shared")
+        other.add_message_count("my-project", 4)
+        manager.add_message_count("my-project", 2)
+
+        metadata = manager.get_room_metadata("my-project")
+        assert metadata.message_count == 8
+        assert metadata.description == "Shared"
+
+        manager.update_room_metadata("my-project", message_count=0)
+        assert other.get_room_metadata("my-project").message_count == 0
+
     def test_metadata_update_last_active(self) -> None:
         """Test that RoomMetadata.update_last_active() works."""
         import time
@@ -251,6 +283,28 @@ class TestRoomManager:
 
         assert metadata.last_active > original_last_active
 
+    def test_metadata_last_active_epoch(self) -> None:
+        """Test that the epoch is derived from last_active and kept in sync."""
+        metadata = RoomMetadata(
+            name="test", created_at="2024-01-01T00:00:00", last_active="2024-01-01T00:00:00"
+        )
+        assert metadata.last_active_epoch == 1704067200.0
+
+        metadata.update_last_active()
+        restored = RoomMetadata(**metadata.model_dump())
+        assert restored.last_active_epoch == metadata.last_active_epoch > 1704067200.0
+
+    def test_metadata_display_last_active(self) -> None:
+        """Test the display timestamp and its refresh on update."""
+        metadata = RoomMetadata(
+            name="test", created_at="2024-01-01T00:00:00", last_active="2024-01-01T12:34:56.789"
+        )
+        assert metadata.display_last_active == "2024-01-01 12:34:56"
+        assert "display_last_active" not in metadata.model_dump()
+
+        metadata.update_last_active()
+        assert metadata.display_last_active == metadata.last_active[:19].replace("T", " ")
+
     def test_metadata_increment_message_count(self) -> None:
         """Test that RoomMetadata.increment_message_count() works."""
         metadata = RoomMetadata(
@@ -283,6 +337,46 @@ class TestRoomManager:
         with pytest.raises(FileNotFoundError, match="does not exist"):
             manager.get_room_path("nonexistent")
 
+    def test_list_rooms_reuses_unchanged_metadata(self, manager: RoomManager, monkeypatch) -> None:
+        """Test that list_rooms only re-reads metadata files that changed."""
+        manager.create_room("room-a")
+        manager.create_room("room-b")
+        manager.list_rooms()
+
+        reads = []
+        original = Path.read_bytes
+        monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self.parent.name) or original(self))
+
+        rooms = manager.list_rooms()
+        assert reads == []
+        assert {room.name for room in rooms} == {"room-a", "room-b"}
+
+        # Returned objects are copies
+        rooms[0].message_count = 99
+        assert all(room.message_count == 0 for room in manager.list_rooms())
+
+        manager.update_room_metadata("room-a", description="Changed")
+        reads.clear()
+        rooms = {room.name: room for room in manager.list_rooms()}
+        assert reads == ["room-a"]
+        assert rooms["room-a"].description == "Changed"
+
+        manager.delete_room("room-b")
+        assert [room.name for room in manager.list_rooms()] == ["room-a"]
+
+    def test_get_room_manager_shared(self, temp_dir: Path, monkeypatch) -> None:
+        """Test that get_room_manager() reuses one instance until cleared."""
+        from ateam.core import get_room_manager
+
+        monkeypatch.setenv("HOME", str(temp_dir))
+        get_room_manager.cache_clear()
+        try:
+            manager = get_room_manager()
+            assert get_room_manager() is manager
+            assert manager.base_dir.is_relative_to(temp_dir)
+        finally:
+            get_room_manager.cache_clear()
+
 
 if __name__ == "__main__":
     # Run tests manually
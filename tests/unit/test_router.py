@@ -17,6 +17,13 @@ from ateam.core.router import AgentRouter
 class TestRouter:
     """Test suite for AgentRouter and Config."""
 
+    @pytest.fixture(autouse=True)
+    def home(self, tmp_path, monkeypatch):
+        # Keep the parsed-config cache out of the real home directory
+        home = tmp_path / "home"
+        monkeypatch.setenv("HOME", str(home))
+        return home
+
     @pytest.fixture
     def mock_config(self, tmp_path):
         config_content = """
@@ -45,6 +52,33 @@ agents:
         assert cm.config.default_agent == "Architect"
         assert len(cm.config.agents) == 2
         assert cm.get_agent("Coder").provider == "openai"
+        assert cm.get_agent("coder") is cm.get_agent("Coder")
+        with pytest.raises(ValueError):
+            cm.get_agent("Ghost")
+        assert cm.has_agent("Coder") and cm.has_agent("coder")
+        assert not cm.has_agent("Ghost")
+
+    def test_config_cache(self, mock_config, home):
+        cm = ConfigManager(mock_config)
+        # Cached under the home directory, not next to config.yaml
+        assert sorted(p.name for p in mock_config.parent.iterdir()) == ["config.yaml", "home"]
+        assert cm._cache_path().exists()
+        assert cm._cache_path().is_relative_to(home / ".cache" / "ateam")
+        assert [p.name for p in cm._cache_path().parent.iterdir()] == [cm._cache_path().name]
+
+        # An unchanged file is served from the cache
+        with patch("ateam.core.config.yaml.load") as mock_load:
+            cached = ConfigManager(mock_config)
+            mock_load.assert_not_called()
+        assert cached.config == cm.config
+
+        # Editing the file invalidates it
+        mock_config.write_text(mock_config.read_text().replace('default_agent: "Architect"', 'default_agent: "Coder"'))
+        assert ConfigManager(mock_config).config.default_agent == "Coder"
+
+    def test_config_cache_corrupt(self, mock_config):
+        ConfigManager(mock_config)._cache_path().write_bytes(b"garbage")
+        assert ConfigManager(mock_config).config.default_agent == "Architect"
 
     def test_agent_selection_default(self, mock_config):
         cm = ConfigManager(mock_config)
@@ -79,6 +113,81 @@ agents:
         assert agent == "Architect"
         assert "@Unknown Hello" in text or "Hello" in text # depends on implementation detail, currently it keeps text if fallback
 
+    def test_select_agents_strips_only_agent_mentions(self, mock_config):
+        cm = ConfigManager(mock_config)
+        router = AgentRouter(cm)
+
+        agents, text = router.select_agents("@Coder @Ghost fix @Coders and @Coder")
+        assert agents == ["Coder"]
+        assert text == "@Ghost fix @Coders and"
+
+    def test_provider_cache_invalidation(self, mock_config):
+        cm = ConfigManager(mock_config)
+        router = AgentRouter(cm)
+
+        with patch("ateam.providers.ProviderFactory.create", side_effect=lambda *a: MagicMock()):
+            provider = router.get_provider_for_agent("Coder", "key-1")
+            assert router.get_provider_for_agent("Coder", "key-1") is provider
+
+            # A rotated key replaces the agent's provider
+            rotated = router.get_provider_for_agent("Coder", "key-2")
+            assert rotated is not provider
+            assert len(router._provider_cache) == 1
+
+            # So does reloading the config
+            cm.load()
+            assert router.get_provider_for_agent("Coder", "key-2") is not rotated
+            assert len(router._provider_cache) == 1
+
+    def test_provider_cache_keyed_by_api_key_digest(self, mock_config):
+        router = AgentRouter(ConfigManager(mock_config))
+
+        with patch("ateam.providers.ProviderFactory.create", side_effect=lambda *a: MagicMock()) as create:
+            provider = router.get_provider_for_agent("Coder", "sk-secret-1")
+            # The same key reuses the cached provider
+            assert router.get_provider_for_agent("Coder", "sk-secret-1") is provider
+            assert create.call_count == 1
+
+            # A rotated key builds a new one
+            assert router.get_provider_for_agent("Coder", "sk-secret-2") is not provider
+            assert create.call_count == 2
+            assert create.call_args.args[2] == "sk-secret-2"
+
+        # The plaintext key is never part of a cache key
+        for key in [*router._provider_cache, *router._agent_keys.values()]:
+            assert "sk-secret-2" not in key
+            assert "sk-secret-2" not in repr(key)
+
+    def test_provider_shared_between_agents(self, mock_config):
+        mock_config.write_text(mock_config.read_text() + """
+  Reviewer:
+    provider: openai
+    model: gpt-4
+    system_prompt: "You are a reviewer"
+    temperature: 0.5
+""")
+        router = AgentRouter(ConfigManager(mock_config))
+
+        with patch("ateam.providers.ProviderFactory.create", side_effect=lambda *a: MagicMock()) as create:
+            provider = router.get_provider_for_agent("Coder", "key-1")
+            # Same provider settings and key: one shared provider
+            assert router.get_provider_for_agent("Reviewer", "key-1") is provider
+            assert create.call_count == 1
+
+            # The shared provider stays while another agent still uses it
+            router.get_provider_for_agent("Coder", "key-2")
+            assert router.get_provider_for_agent("Reviewer", "key-1") is provider
+            assert router.get_provider_for_agent("Architect", "key-1") is not provider
+            assert len(router._provider_cache) == 3
+
+    def test_mentions_ignore_email_addresses(self, mock_config):
+        router = AgentRouter(ConfigManager(mock_config))
+
+        assert router.parse_mentions("mail coder@Coder.io, @Coder (cc @Ghost_1)") == ["Coder", "Ghost_1"]
+        agents, cleaned = router.select_agents("ping dev@Coder.com")
+        assert agents == ["Architect"]
+        assert cleaned == "ping dev@Coder.com"
+
     def test_detect_handoff(self, mock_config):
         cm = ConfigManager(mock_config)
         router = AgentRouter(cm)
@@ -131,3 +240,42 @@ agents:
             assert args[0] == "openai"
             assert args[1].model_name == "gpt-4"
             assert args[2] == "fake-key"
+
+    @pytest.mark.asyncio
+    async def test_routing_leaves_history_unchanged(self, mock_config):
+        from unittest.mock import AsyncMock
+        router = AgentRouter(ConfigManager(mock_config))
+        history = [{"role": "assistant", "content": "Hi"}]
+        seen = []
+
+        async def complete(messages, system_prompt=None):
+            # The caller appending mid-request doesn't reach the provider's list
+            history.append({"role": "user", "content": "meanwhile"})
+            seen.append(list(messages))
+            return "ok"
+
+        with patch("ateam.providers.ProviderFactory.create") as mock_create:
+            mock_create.return_value.complete = AsyncMock(side_effect=complete)
+            assert await router.route_and_complete("@Coder fix it", history, lambda env: "fake-key") == ("Coder", "ok")
+
+        assert seen == [[{"role": "assistant", "content": "Hi"}, {"role": "user", "content": "fix it"}]]
+        assert history == [{"role": "assistant", "content": "Hi"}, {"role": "user", "content": "meanwhile"}]
+
+    @pytest.mark.asyncio
+    async def test_routing_leaves_history_unchanged_on_error(self, mock_config):
+        from unittest.mock import AsyncMock
+        router = AgentRouter(ConfigManager(mock_config))
+        history = [{"role": "assistant", "content": "Hi"}]
+        seen = []
+
+        async def complete(messages, system_prompt=None):
+            seen.append(list(messages))
+            raise RuntimeError("provider down")
+
+        with patch("ateam.providers.ProviderFactory.create") as mock_create:
+            mock_create.return_value.complete = AsyncMock(side_effect=complete)
+            with pytest.raises(RuntimeError):
+                await router.route_and_complete("@Coder fix it", history, lambda env: "fake-key")
+
+        assert seen == [[{"role": "assistant", "content": "Hi"}, {"role": "user", "content": "fix it"}]]
+        assert history == [{"role": "assistant", "content": "Hi"}]
@@ -44,6 +44,9 @@ class TestTools:
         assert calls[0]["name"] == "read_file"
         assert calls[1]["name"] == "write_file"
 
+    def test_parse_no_calls(self, tool_manager):
+        assert tool_manager.parse_calls("Plain answer mentioning tool_call syntax.") == []
+
     @pytest.mark.asyncio
     async def test_file_read_tool(self, tmp_path):
         test_file = tmp_path / "hello.txt"
@@ -82,3 +85,30 @@ class TestTools:
             result = await tool_manager.run_tool(call_info)
             assert result == "wrote"
             mock_write.assert_called_once_with(path="a.txt", content="content")
+
+    def test_plugin_manager_reuses_unchanged_plugins(self, tmp_path):
+        from ateam.mcp.manager import PluginManager
+        plugin = tmp_path / "echo.py"
+        plugin.write_text(
+            "from ateam.tools.base import BaseTool\n"
+            "class EchoTool(BaseTool):\n"
+            "    def __init__(self):\n"
+            "        super().__init__(name='echo', description='Echo')\n"
+            "    async def execute(self, **kwargs):\n"
+            "        return 'echo'\n",
+            encoding="utf-8",
+        )
+        manager = PluginManager(str(tmp_path))
+
+        tools = manager.load_plugins()
+        assert [t.name for t in tools] == ["echo"]
+        # Unchanged file: same instance, no duplicates
+        assert manager.load_plugins() == tools
+
+        plugin.write_text(plugin.read_text(encoding="utf-8").replace("'echo'", "'echo2'"), encoding="utf-8")
+        reloaded = manager.load_plugins()
+        assert [t.name for t in reloaded] == ["echo2"]
+
+        plugin.unlink()
+        assert manager.load_plugins() == []
+
@@ -0,0 +1,54 @@
+"""
+Tests for TranscriptWriter.
+
+Tests cover:
+- Buffered appends written on flush/close
+- Truncating the transcript
+"""
+
+from pathlib import Path
+
+import orjson
+import pytest
+
+from ateam.core.transcript import TranscriptWriter
+
+
+class TestTranscriptWriter:
+    """Test suite for TranscriptWriter."""
+
+    @pytest.fixture
+    def writer(self, tmp_path: Path):
+        """Create a writer in a temporary directory."""
+        w = TranscriptWriter(tmp_path / "transcript.jsonl")
+        yield w
+        w.close()
+
+    def test_append_is_buffered_until_flush(self, writer: TranscriptWriter):
+        """Test that records reach disk on flush as JSON lines."""
+        writer.append("user", "Hello")
+        writer.append("assistant", "Hi there", agent_tag="Coder")
+        assert writer.path.read_bytes() == b""
+
+        writer.flush()
+        records = [orjson.loads(line) for line in writer.path.read_bytes().splitlines()]
+        assert [(r["role"], r["content"], r["agent_tag"]) for r in records] == [
+            ("user", "Hello", None),
+            ("assistant", "Hi there", "Coder"),
+        ]
+
+    def test_close_and_reopen_appends(self, writer: TranscriptWriter):
+        """Test that a closed writer reopens in append mode."""
+        writer.append("user", "First")
+        writer.close()
+        writer.append("user", "Second")
+        writer.close()
+
+        assert len(writer.path.read_bytes().splitlines()) == 2
+
+    def test_clear(self, writer: TranscriptWriter):
+        """Test that clear truncates the transcript."""
+        writer.append("user", "Secret")
+        writer.clear()
+
+        assert writer.path.read_bytes() == b""
@@ -65,6 +65,13 @@ class TestInputValidator:
         # Should normalize to max 3 consecutive newlines
         assert "\n\n\n\n" not in result.content
 
+    def test_validate_message_line_limit(self, validator: InputValidator) -> None:
+        """Test that messages are limited to 1000 lines."""
+        assert validator.validate_message("x\n" * 999 + "x")
+
+        with pytest.raises(ValueError, match="1000 lines"):
+            validator.validate_message("x\n" * 1000 + "x")
+
     def test_validate_message_invalid_agent_tag(self, validator: InputValidator) -> None:
         """Test that invalid agent tags are rejected."""
         with pytest.raises(ValueError, match="can only contain"):